@@ -35,9 +35,15 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
@@ -46,7 +52,7 @@ setup(
         ],
         "test": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
         ],
     },
@@ -9,10 +9,12 @@ from .client import OmnixClient
 from .models import (
     Bucket,
     ObjectMetadata,
+    ObjectMetadataLite,
     ListObjectsResult,
     PutObjectResult,
     PresignedUrlResult,
     BucketPolicyResult,
+    MultipartUpload,
 )
 from .error import (
     OmnixStorageException,
@@ -29,10 +31,12 @@ __all__ = [
     "OmnixClient",
     "Bucket",
     "ObjectMetadata",
+    "ObjectMetadataLite",
     "ListObjectsResult",
     "PutObjectResult",
     "PresignedUrlResult",
     "BucketPolicyResult",
+    "MultipartUpload",
     "OmnixStorageException",
     "BucketNotFoundException",
     "BucketAlreadyExistsException",
@@ -3,8 +3,59 @@ HTTP client utilities for OmnixStorage SDK
 """
 
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, BinaryIO
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, UTC
 import asyncio
+import random
+
+from . import __version__
+
+
+# Responses that indicate a transient server-side condition worth retrying.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# A 502/504 may arrive after the server already acted, so non-idempotent
+# methods (POST) are only retried on statuses that mean the request was refused.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+USER_AGENT = f"omnix-storage-py/{__version__}"
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class UploadStream:
+    """
+    Async request body that streams a binary file in fixed-size chunks.
+
+    Seekable files are rewound to their starting offset on every iteration so
+    the body can be replayed by the retry loop.
+    """
+    
+    def __init__(self, fp: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._consumed = False
+        try:
+            self._start: Optional[int] = fp.tell()
+            self.length: Optional[int] = fp.seek(0, 2) - self._start
+            fp.seek(self._start)
+        except (AttributeError, OSError, ValueError):
+            self._start = None
+            self.length = None
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._start is not None:
+            self._fp.seek(self._start)
+        elif self._consumed:
+            raise httpx.StreamConsumed()
+        self._consumed = True
+        while True:
+            chunk = self._fp.read(self._chunk_size)
+            if not chunk:
+                break
+            yield chunk
 
 
 class HttpClient:
@@ -12,12 +63,29 @@ class HttpClient:
     HTTP client wrapper with connection pooling and retry logic.
     """
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+    ):
         self.timeout = timeout
         self.max_retries = max_retries
+        # http2=True requires the optional "h2" package (pip install omnix-storage[http2]).
+        # Headers shared by every request are set once on the pooled client;
+        # httpx merges them with per-request headers.
         self._client = httpx.AsyncClient(
             timeout=timeout,
-            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
         )
     
     async def get(
@@ -83,24 +151,86 @@ class HttpClient:
         """Make a HEAD request with retry logic."""
         return await self._request("HEAD", url, headers=headers, **kwargs)
     
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make a request for any method with retry logic."""
+        return await self._request(method, url, headers=headers, **kwargs)
+    
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """Make a request with retry logic, leaving the response body unread for streaming."""
+        response = await self._request(method, url, headers=headers, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+    
     async def _request(
         self,
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
         **kwargs
     ) -> httpx.Response:
-        """Make HTTP request with exponential backoff retry logic."""
+        """Make HTTP request with jittered exponential backoff retry logic."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            retryable_status_codes = RETRYABLE_STATUS_CODES
+        else:
+            retryable_status_codes = NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
         for attempt in range(self.max_retries):
+            is_last_attempt = attempt == self.max_retries - 1
             try:
-                response = await self._client.request(method, url, headers=headers, **kwargs)
-                return response
+                request = self._client.build_request(method, url, headers=headers, **kwargs)
+                response = await self._client.send(request, stream=stream)
             except httpx.RequestError:
-                if attempt < self.max_retries - 1:
-                    wait_time = min(1000 * (2 ** attempt), 10000) / 1000
-                    await asyncio.sleep(wait_time)
-                else:
+                if is_last_attempt:
                     raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+
+            if is_last_attempt or response.status_code not in retryable_status_codes:
+                return response
+
+            delay = self._retry_after_delay(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            await response.aclose()
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Capped exponential backoff with +/-50% jitter to avoid retry storms."""
+        return min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY) * (0.5 + random.random())
+    
+    @staticmethod
+    def _retry_after_delay(response: httpx.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date), capped at the max delay."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            delay = (retry_at - datetime.now(UTC)).total_seconds()
+        return min(max(delay, 0.0), RETRY_MAX_DELAY)
     
     async def close(self):
         """Close the HTTP client."""
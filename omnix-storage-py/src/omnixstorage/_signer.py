@@ -6,19 +6,52 @@ import hashlib
 import hmac
 import json
 from datetime import datetime, UTC
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 
+_ALGORITHM_PREFIX = b"AWS4-HMAC-SHA256\n"
+DEFAULT_REGION = "us-east-1"
+DEFAULT_SERVICE = "s3"
+# Derived keys change once per day; a handful of slots covers date rollover
+# and any extra region/service scopes.
+_SIGNING_KEY_CACHE_MAX_ENTRIES = 8
+# SHA-256 of the empty payload.
+_EMPTY_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+# Presigned URLs sign only the host header and an empty payload, so the tail
+# of their canonical request is constant.
+_PRESIGN_CANONICAL_TAIL = b"\nhost\n" + _EMPTY_SHA256.encode()
+# Presigned URL lifetime limits defined by the S3 specification.
+MAX_PRESIGN_EXPIRY_SECONDS = 604800
+EXPIRY_ERROR_MESSAGE = (
+    f"Expiry must be between 1 second and {MAX_PRESIGN_EXPIRY_SECONDS} seconds (7 days) per AWS S3 specification."
+)
+
+
+def _format_amz_date(t: datetime) -> str:
+    """Format a timestamp as an ISO 8601 basic X-Amz-Date value (YYYYMMDDTHHMMSSZ)."""
+    return f"{t.year:04d}{t.month:02d}{t.day:02d}T{t.hour:02d}{t.minute:02d}{t.second:02d}Z"
+
+
 class AwsSignatureV4Signer:
     """
     Signs requests using AWS Signature Version 4.
     Used for presigned URL generation.
+    
+    The derived signing key is cached per day, so each signature costs one
+    SHA-256 of the canonical request and one HMAC-SHA256. Both go through
+    hashlib/hmac, which dispatch to OpenSSL (hardware-accelerated SHA-256 where
+    the CPU supports it), so no native signing backend is needed.
     """
     
     def __init__(self, access_key: str, secret_key: str):
         self.access_key = access_key
         self.secret_key = secret_key
+        self._k_secret = f"AWS4{secret_key}".encode()
+        self._aws4_request_b = b"aws4_request"
+        # (datestamp, region, service) -> kSigning. Plain dict operations are
+        # atomic under the GIL, so the cache is safe to share across coroutines.
+        self._signing_key_cache: Dict[Tuple[str, str, str], bytes] = {}
     
     def sign_request(
         self,
@@ -36,15 +69,13 @@ class AwsSignatureV4Signer:
         if timestamp is None:
             timestamp = datetime.now(UTC)
         
-        amz_date = timestamp.strftime("%Y%m%dT%H%M%SZ")
-        datestamp = timestamp.strftime("%Y%m%d")
+        amz_date = _format_amz_date(timestamp)
+        datestamp = amz_date[:8]
         
         # Canonical request
-        canonical_headers_dict = self._build_canonical_headers(headers or {})
-        canonical_headers_str = "\n".join(
-            f"{k}:{v}" for k, v in sorted(canonical_headers_dict.items())
-        ) + "\n"
-        signed_headers = ";".join(sorted(canonical_headers_dict.keys()))
+        canonical_header_items = self._build_canonical_headers(headers or {})
+        canonical_headers_str = "\n".join(f"{k}:{v}" for k, v in canonical_header_items)
+        signed_headers = ";".join(k for k, _ in canonical_header_items)
         
         canonical_querystring = self._build_canonical_querystring(query_params or {})
         payload_hash = self._hash_payload(body)
@@ -53,32 +84,19 @@ class AwsSignatureV4Signer:
             method,
             path,
             canonical_querystring,
-            canonical_headers_str.rstrip(),
+            canonical_headers_str,
             "",
             signed_headers,
             payload_hash,
-        ])
+        ]).encode()
         
         # String to sign
         credential_scope = f"{datestamp}/us-east-1/s3/aws4_request"
-        canonical_request_hash = hashlib.sha256(
-            canonical_request.encode()
-        ).hexdigest()
-        
-        string_to_sign = "\n".join([
-            "AWS4-HMAC-SHA256",
-            amz_date,
-            credential_scope,
-            canonical_request_hash,
-        ])
+        string_to_sign = self._build_string_to_sign(amz_date, credential_scope, canonical_request)
         
         # Signature
         signing_key = self._derive_signing_key(datestamp)
-        signature = hmac.new(
-            signing_key,
-            string_to_sign.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        signature = hmac.digest(signing_key, string_to_sign, "sha256").hex()
         
         # Authorization header
         auth_header = (
@@ -91,12 +109,9 @@ class AwsSignatureV4Signer:
             "X-Amz-Date": amz_date,
         }
     
-    def _build_canonical_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
-        """Build canonical headers for signing."""
-        canonical = {}
-        for key, value in headers.items():
-            canonical[key.lower()] = value.strip()
-        return canonical
+    def _build_canonical_headers(self, headers: Dict[str, str]) -> List[Tuple[str, str]]:
+        """Build canonical headers for signing as (name, value) pairs sorted by name."""
+        return sorted((key.lower(), value.strip()) for key, value in headers.items())
     
     def _build_canonical_querystring(self, params: Dict[str, str]) -> str:
         """Build canonical query string for signing."""
@@ -108,25 +123,42 @@ class AwsSignatureV4Signer:
             for k, v in sorted_params
         )
     
+    def _build_string_to_sign(self, amz_date: str, credential_scope: str, canonical_request: bytes) -> bytes:
+        """Build the SigV4 string to sign from an already-encoded canonical request."""
+        canonical_request_hash = hashlib.sha256(canonical_request).hexdigest()
+        return _ALGORITHM_PREFIX + f"{amz_date}\n{credential_scope}\n{canonical_request_hash}".encode()
+    
     def _hash_payload(self, body: Optional[bytes]) -> str:
         """Hash the request payload."""
-        if body is None:
-            return hashlib.sha256(b"").hexdigest()
+        if not body:
+            return _EMPTY_SHA256
         return hashlib.sha256(body).hexdigest()
     
+    def get_signing_key(
+        self,
+        datestamp: str,
+        region: str = DEFAULT_REGION,
+        service: str = DEFAULT_SERVICE,
+    ) -> bytes:
+        """Return the SigV4 signing key for a YYYYMMDD date and scope, derived at most once per scope."""
+        cache_key = (datestamp, region, service)
+        k_signing = self._signing_key_cache.get(cache_key)
+        if k_signing is not None:
+            return k_signing
+
+        k_date = hmac.digest(self._k_secret, datestamp.encode(), "sha256")
+        k_region = hmac.digest(k_date, region.encode(), "sha256")
+        k_service = hmac.digest(k_region, service.encode(), "sha256")
+        k_signing = hmac.digest(k_service, self._aws4_request_b, "sha256")
+        
+        if len(self._signing_key_cache) >= _SIGNING_KEY_CACHE_MAX_ENTRIES:
+            self._signing_key_cache.clear()
+        self._signing_key_cache[cache_key] = k_signing
+        return k_signing
+    
     def _derive_signing_key(self, datestamp: str) -> bytes:
         """Derive the signing key for AWS Signature V4."""
-        k_date = hmac.new(
-            f"AWS4{self.secret_key}".encode(),
-            datestamp.encode(),
-            hashlib.sha256
-        ).digest()
-        
-        k_region = hmac.new(k_date, "us-east-1".encode(), hashlib.sha256).digest()
-        k_service = hmac.new(k_region, "s3".encode(), hashlib.sha256).digest()
-        k_signing = hmac.new(k_service, "aws4_request".encode(), hashlib.sha256).digest()
-        
-        return k_signing
+        return self.get_signing_key(datestamp)
     
     def generate_presigned_url(
         self,
@@ -145,16 +177,14 @@ class AwsSignatureV4Signer:
         # Support both expires_in and expires_in_seconds for backward compatibility
         expiry = expires_in_seconds if expires_in_seconds is not None else expires_in
 
-        if expiry < 1 or expiry > 604800:
-            raise ValueError(
-                "Expiry must be between 1 second and 604800 seconds (7 days) per AWS S3 specification."
-            )
+        if expiry < 1 or expiry > MAX_PRESIGN_EXPIRY_SECONDS:
+            raise ValueError(EXPIRY_ERROR_MESSAGE)
         
         if timestamp is None:
             timestamp = datetime.now(UTC)
         
-        amz_date = timestamp.strftime("%Y%m%dT%H%M%SZ")
-        datestamp = timestamp.strftime("%Y%m%d")
+        amz_date = _format_amz_date(timestamp)
+        datestamp = amz_date[:8]
         
         # Create credential scope
         credential_scope = f"{datestamp}/us-east-1/s3/aws4_request"
@@ -173,42 +203,19 @@ class AwsSignatureV4Signer:
         
         # Build canonical request
         canonical_querystring = self._build_canonical_querystring(presigned_params)
-        payload_hash = self._hash_payload(None)
-        
-        canonical_request = "\n".join([
-            method,
-            path,
-            canonical_querystring,
-            "host:" + host,
-            "",
-            "host",
-            payload_hash,
-        ])
+        canonical_request = (
+            f"{method}\n{path}\n{canonical_querystring}\nhost:{host}\n".encode()
+            + _PRESIGN_CANONICAL_TAIL
+        )
         
         # String to sign
-        canonical_request_hash = hashlib.sha256(
-            canonical_request.encode()
-        ).hexdigest()
-        
-        string_to_sign = "\n".join([
-            "AWS4-HMAC-SHA256",
-            amz_date,
-            credential_scope,
-            canonical_request_hash,
-        ])
+        string_to_sign = self._build_string_to_sign(amz_date, credential_scope, canonical_request)
         
         # Signature
         signing_key = self._derive_signing_key(datestamp)
-        signature = hmac.new(
-            signing_key,
-            string_to_sign.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
-        # Build presigned URL
-        presigned_params["X-Amz-Signature"] = signature
+        signature = hmac.digest(signing_key, string_to_sign, "sha256").hex()
         
+        # Build presigned URL. X-Amz-Signature is not part of the canonical
+        # request, so it is appended to the already-encoded query string.
         scheme = "https" if use_https else "http"
-        url = f"{scheme}://{host}{path}"
-        query_string = self._build_canonical_querystring(presigned_params)
-        return f"{url}?{query_string}"
+        return f"{scheme}://{host}{path}?{canonical_querystring}&X-Amz-Signature={signature}"
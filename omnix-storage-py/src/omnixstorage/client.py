@@ -2,36 +2,123 @@
 OmnixClient - S3-compatible client for OmnixStorage
 """
 
+import asyncio
+import base64
+import ipaddress
 import json
 import logging
+import re
+import time
 import warnings
+import weakref
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, UTC
-from typing import Optional, Dict, BinaryIO, List
-from urllib.parse import urljoin, urlparse, urlunparse, quote
+from typing import Optional, Dict, BinaryIO, List, Tuple, AsyncIterator, Awaitable, Iterable, Mapping, TypeVar
+from urllib.parse import urlparse, urlunparse, quote, urlencode
 
-from ._http import HttpClient
-from ._signer import AwsSignatureV4Signer
+import httpx
+
+try:
+    # Optional faster JSON codec (pip install omnix-storage[fast]).
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - depends on installed extras
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+from ._http import HttpClient, UploadStream, DEFAULT_CHUNK_SIZE
+from ._signer import AwsSignatureV4Signer, EXPIRY_ERROR_MESSAGE, MAX_PRESIGN_EXPIRY_SECONDS
 from .models import (
     Bucket,
     ObjectMetadata,
+    ObjectMetadataLite,
     ListObjectsResult,
     PutObjectResult,
     PresignedUrlResult,
+    MultipartUpload,
 )
 from .error import (
     OmnixStorageException,
     BucketNotFoundException,
+    BucketAlreadyExistsException,
     ObjectNotFoundException,
     AuthenticationException,
     ServerException,
 )
 
 
+# Refresh window used when a JWT carries no readable "exp" claim.
+_DEFAULT_TOKEN_TTL_SECONDS = 7 * 3600
+# Refresh tokens this many seconds before their "exp" claim, capped at a
+# fraction of the token lifetime so short-lived tokens stay usable.
+_TOKEN_EXPIRY_SKEW_SECONDS = 60
+_TOKEN_EXPIRY_SKEW_FRACTION = 0.1
+# Never cache a token for less than this, so requests cannot trigger a login each.
+_MIN_TOKEN_TTL_SECONDS = 5.0
+# Within this window before expiry (capped at half the token lifetime) the
+# cached token is still served while a background refresh runs.
+_TOKEN_STALE_WINDOW_SECONDS = 600
+# After a failed background refresh, wait this long before starting another.
+_TOKEN_REFRESH_RETRY_SECONDS = 30.0
+# Upper bound on presigned URLs kept in the per-client cache.
+_PRESIGN_CACHE_MAX_ENTRIES = 10_000
+# Fraction of a presigned URL's lifetime that must remain for a cached URL to be
+# reused, so callers never get less than 75% of the expiry they asked for.
+_PRESIGN_CACHE_MIN_REMAINING = 0.75
+# How long bucket_exists answers are reused; misses expire sooner so a bucket
+# created elsewhere is noticed quickly.
+_BUCKET_EXISTS_TTL_SECONDS = 60.0
+_BUCKET_MISSING_TTL_SECONDS = 5.0
+
+# Methods _make_request accepts, and those among them that carry a request body.
+_SUPPORTED_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "POST"})
+_BODY_METHODS = frozenset({"PUT", "POST"})
+
+# HTTP clients shared by OmnixClient.from_shared, keyed by (endpoint, use_ssl).
+# Entries disappear once no OmnixClient references them.
+_shared_http_clients: "weakref.WeakValueDictionary[Tuple[str, bool], HttpClient]" = weakref.WeakValueDictionary()
+# Number of open OmnixClients using each shared HTTP client; the last close() closes it.
+_shared_http_refs: "weakref.WeakKeyDictionary[HttpClient, int]" = weakref.WeakKeyDictionary()
+
+# Hostnames that are never reachable from a browser; IP literals are
+# classified with the ipaddress module instead.
+_INTERNAL_HOSTNAME_RE = re.compile(r"^localhost$|\.local$|\.internal$")
+# Default number of in-flight requests for the bulk helpers.
+DEFAULT_BULK_CONCURRENCY = 32
+# S3 limit on keys in a single multi-object delete request.
+MAX_DELETE_KEYS_PER_REQUEST = 1000
+
+T = TypeVar("T")
+
+
+async def _gather_bounded(awaitables: Iterable[Awaitable[T]], concurrency: int) -> List[T]:
+    """Await all awaitables with at most ``concurrency`` running at once, preserving order."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(run(aw) for aw in awaitables)))
+
+
 class OmnixClient:
     """
     S3-compatible client for OmnixStorage.
     
+    Each client owns a pooled keep-alive HTTP connection pool, so create one
+    long-lived client per endpoint and share it across the application (or use
+    OmnixClient.from_shared) rather than constructing one per request.
+    
     Example:
         client = OmnixClient(
             endpoint="omnix.production.local:9000",
@@ -60,6 +147,12 @@ class OmnixClient:
         use_ssl: bool = False,
         request_timeout: int = 30,
         max_retries: int = 3,
+        http_client: Optional[HttpClient] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
     ):
         """
         Initialize OmnixClient.
@@ -74,7 +167,18 @@ class OmnixClient:
             use_ssl: Use HTTPS instead of HTTP
             request_timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            http_client: Existing HttpClient to reuse. The caller keeps ownership, so
+                close() leaves it open; request_timeout, max_retries and the
+                connection-pool options are ignored.
+            chunk_size: Bytes read or written per chunk when streaming object bodies
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle pooled connection is kept open
+            http2: Negotiate HTTP/2 (requires the optional "h2" package)
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1 byte.")
+
         self.endpoint = endpoint
         self.username = username
         self.password = password
@@ -82,15 +186,65 @@ class OmnixClient:
         self.secret_key = secret_key
         self.use_ssl = use_ssl
         self.base_url = f"{'https' if use_ssl else 'http'}://{endpoint}"
+        self._base_url_norm = self.base_url.rstrip("/")
+        self._auth_url = self._base_url_norm + "/api/admin/auth/login"
         self.public_endpoint = public_endpoint
         self.public_base_url = self._to_base_url(public_endpoint) if public_endpoint else None
+        # Endpoints are fixed after construction, so parse them once for presigning.
+        self._internal_presign_ctx = self._presign_context(self.base_url)
+        self._public_presign_ctx = self._presign_context(self.public_base_url) if self.public_base_url else None
+        self._public_host = (urlparse(self.public_base_url).hostname or "") if self.public_base_url else ""
         
-        self._http = HttpClient(timeout=request_timeout, max_retries=max_retries)
+        self._chunk_size = chunk_size
+        self._owns_http = http_client is None
+        self._shares_http = False  # set by from_shared
+        self._http = http_client if http_client is not None else HttpClient(
+            timeout=request_timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
         self._signer = AwsSignatureV4Signer(access_key, secret_key)
         self._jwt_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        self._auth_header: Optional[str] = None
+        self._auth_lock = asyncio.Lock()
+        self._token_expires_at: float = 0.0  # time.monotonic() deadline
+        self._token_stale_at: float = 0.0  # time.monotonic() background-refresh threshold
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_retry_at: float = 0.0  # time.monotonic() before which no background refresh starts
+        self._presign_cache: "OrderedDict[tuple, Tuple[PresignedUrlResult, float]]" = OrderedDict()
+        # bucket name -> (exists, monotonic deadline)
+        self._bucket_exists_cache: Dict[str, Tuple[bool, float]] = {}
         self._logger = logging.getLogger(__name__)
 
+    @classmethod
+    def from_shared(
+        cls,
+        endpoint: str = "localhost:9000",
+        use_ssl: bool = False,
+        **kwargs,
+    ) -> "OmnixClient":
+        """
+        Create a client that reuses the connection pool of other shared clients
+        for the same endpoint, avoiding a new TCP/TLS handshake per instance.
+
+        The pool is created with the first caller's timeout, retry and pool
+        options and must be used from a single event loop. It is closed when
+        the last client sharing it is closed.
+        """
+        key = (endpoint, use_ssl)
+        shared = _shared_http_clients.get(key)
+        if shared is not None and shared._client.is_closed:
+            shared = None
+        client = cls(endpoint=endpoint, use_ssl=use_ssl, http_client=shared, **kwargs)
+        client._owns_http = False
+        client._shares_http = True
+        _shared_http_clients[key] = client._http
+        _shared_http_refs[client._http] = _shared_http_refs.get(client._http, 0) + 1
+        return client
+
     def _to_base_url(self, endpoint: str) -> str:
         """Normalize endpoint value to base URL form."""
         if endpoint.startswith("http://") or endpoint.startswith("https://"):
@@ -112,46 +266,83 @@ class OmnixClient:
         )
         return urlunparse(rewritten)
 
+    @staticmethod
+    def _encode_path(bucket_name: str, object_name: Optional[str] = None) -> str:
+        """Build a percent-encoded request path; "/" is kept in object names for folder semantics."""
+        path = f"/{quote(bucket_name, safe='')}"
+        if object_name is not None:
+            path += f"/{quote(object_name, safe='/')}"
+        return path
+
     @staticmethod
     def _is_internal_host(host: str) -> bool:
-        normalized = host.strip().lower()
-        if normalized in {"localhost", "127.0.0.1", "::1"}:
-            return True
-        if normalized.endswith(".local") or normalized.endswith(".internal"):
-            return True
-        if normalized.startswith("10.") or normalized.startswith("192.168."):
-            return True
-        if normalized.startswith("172."):
-            parts = normalized.split(".")
-            if len(parts) > 1:
-                try:
-                    second = int(parts[1])
-                    if 16 <= second <= 31:
-                        return True
-                except ValueError:
-                    pass
-        return False
+        normalized = host.strip().lower().strip("[]")
+        try:
+            address = ipaddress.ip_address(normalized)
+        except ValueError:
+            return _INTERNAL_HOSTNAME_RE.search(normalized) is not None
+        return address.is_private or address.is_loopback
 
     def _validate_expiry(self, expires_in_seconds: int) -> None:
-        if expires_in_seconds < 1 or expires_in_seconds > 604800:
-            raise ValueError(
-                "Expiry must be between 1 second and 604800 seconds (7 days) per AWS S3 specification."
-            )
+        if expires_in_seconds < 1 or expires_in_seconds > MAX_PRESIGN_EXPIRY_SECONDS:
+            raise ValueError(EXPIRY_ERROR_MESSAGE)
+
+    @staticmethod
+    def _presign_context(base_url: str) -> Tuple[str, bool]:
+        """Return the (host, use_https) pair used to sign URLs for a base URL."""
+        parsed = urlparse(base_url)
+        return parsed.netloc, parsed.scheme.lower() == "https"
 
-    def _effective_presigned_base_url(self, browser_accessible: bool) -> str:
-        if browser_accessible and self.public_base_url:
-            return self.public_base_url
+    def _effective_presign_context(self, browser_accessible: bool) -> Tuple[str, bool]:
+        if browser_accessible and self._public_presign_ctx is not None:
+            return self._public_presign_ctx
 
-        if browser_accessible and not self.public_base_url:
+        if browser_accessible:
             warnings.warn(
                 "browser_accessible=True but public_endpoint is not configured. "
                 "Returned URL may use an internal endpoint and fail in browser access.",
                 stacklevel=3,
             )
 
-        return self.base_url
+        return self._internal_presign_ctx
+
+    def _get_cached_presigned_url(self, key: tuple, expires_in_seconds: int) -> Optional[PresignedUrlResult]:
+        """Return a cached presigned URL if enough of its lifetime remains."""
+        entry = self._presign_cache.get(key)
+        if entry is None:
+            return None
+
+        result, deadline = entry
+        if time.monotonic() < deadline - _PRESIGN_CACHE_MIN_REMAINING * expires_in_seconds:
+            self._presign_cache.move_to_end(key)
+            return result
+
+        del self._presign_cache[key]
+        return None
+
+    def _store_presigned_url(self, key: tuple, result: PresignedUrlResult, expires_in_seconds: int) -> None:
+        """Store a presigned URL, evicting the least recently used entry when full."""
+        self._presign_cache[key] = (result, time.monotonic() + expires_in_seconds)
+        self._presign_cache.move_to_end(key)
+        if len(self._presign_cache) > _PRESIGN_CACHE_MAX_ENTRIES:
+            self._presign_cache.popitem(last=False)
 
     def _validate_and_log_presigned_url(self, url: str, expires_in_seconds: int, bucket_name: str, object_name: str) -> str:
+        host = self._validate_presigned_url_host(url)
+        # Checked per call (logging caches the answer) so runtime level changes apply.
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "[OmnixStorage][PresignedUrl] host=%s configuredPublicHost=%s expirySeconds=%s bucket=%s object=%s",
+                host,
+                self._public_host,
+                expires_in_seconds,
+                bucket_name,
+                object_name,
+            )
+        return url
+
+    def _validate_presigned_url_host(self, url: str) -> str:
+        """Reject URLs that a browser cannot use and return their host."""
         parsed = urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             raise ValueError("Generated presigned URL is not a valid absolute URL.")
@@ -163,62 +354,112 @@ class OmnixClient:
                 "Configure public_endpoint for browser-accessible URLs."
             )
 
-        if self.public_base_url:
-            public_host = urlparse(self.public_base_url).hostname or ""
-            if public_host and host.lower() != public_host.lower():
-                raise ValueError(
-                    f"Rejected presigned URL generation because host '{host}' does not match configured public host '{public_host}'."
-                )
-        else:
-            public_host = ""
-
-        self._logger.info(
-            "[OmnixStorage][PresignedUrl] host=%s configuredPublicHost=%s expirySeconds=%s bucket=%s object=%s",
-            host,
-            public_host,
-            expires_in_seconds,
-            bucket_name,
-            object_name,
-        )
-
-        return url
+        public_host = self._public_host
+        if public_host and host.lower() != public_host.lower():
+            raise ValueError(
+                f"Rejected presigned URL generation because host '{host}' does not match configured public host '{public_host}'."
+            )
+        return host
     
+    @staticmethod
+    def _token_ttl_seconds(token: str) -> Optional[float]:
+        """
+        Read the "exp" claim from a JWT and return seconds until refresh is due.
+
+        The signature is not verified; the claim is only used as a cache TTL.
+        Returns None when the token payload cannot be decoded or "exp" is not
+        in the future (e.g. the local clock runs ahead), so the caller falls
+        back to the default TTL instead of logging in on every request.
+        """
+        try:
+            payload_segment = token.split(".")[1]
+            payload = json.loads(base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4)))
+            exp = float(payload["exp"])
+            issued_at = float(payload["iat"]) if "iat" in payload else None
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+        remaining = exp - time.time()
+        if remaining <= 0:
+            return None
+        lifetime = exp - issued_at if issued_at is not None and exp > issued_at else remaining
+        skew = min(_TOKEN_EXPIRY_SKEW_SECONDS, lifetime * _TOKEN_EXPIRY_SKEW_FRACTION)
+        return max(remaining - skew, _MIN_TOKEN_TTL_SECONDS)
+
+    def _has_fresh_token(self) -> bool:
+        """Cheap synchronous check used to skip the auth coroutine on the hot path."""
+        return self._jwt_token is not None and time.monotonic() < self._token_stale_at
+
+    def _has_valid_token(self) -> bool:
+        return self._jwt_token is not None and time.monotonic() < self._token_expires_at
+
+    def _with_auth_header(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Compose a fresh headers dict so caller-owned headers are never mutated."""
+        if headers:
+            return {**headers, "Authorization": self._auth_header}
+        return {"Authorization": self._auth_header}
+
     async def _get_auth_token(self) -> str:
         """Get JWT authentication token with caching."""
-        # Return cached token if still valid
-        if self._jwt_token and self._token_expires_at:
-            if datetime.now(UTC) < self._token_expires_at:
-                return self._jwt_token
+        if self._has_fresh_token():
+            return self._jwt_token
         
+        # Stale but still valid: serve the cached token and refresh in the
+        # background so no caller blocks on the login round-trip.
+        if self._has_valid_token():
+            idle = self._refresh_task is None or self._refresh_task.done()
+            if idle and time.monotonic() >= self._refresh_retry_at:
+                self._refresh_task = asyncio.create_task(self._refresh_token_in_background())
+            return self._jwt_token
+        
+        # Single-flight refresh: concurrent callers wait for the first login
+        # and then pick up the token it cached.
+        async with self._auth_lock:
+            if self._has_valid_token():
+                return self._jwt_token
+            return await self._fetch_auth_token()
+    
+    async def _refresh_token_in_background(self) -> None:
+        """Refresh a stale token; failures are logged and retried in the foreground on expiry."""
+        try:
+            async with self._auth_lock:
+                if not self._has_fresh_token():
+                    await self._fetch_auth_token()
+        except AuthenticationException as ex:
+            self._logger.warning("[OmnixStorage][Auth] Background token refresh failed: %s", ex)
+            self._refresh_retry_at = time.monotonic() + _TOKEN_REFRESH_RETRY_SECONDS
+        finally:
+            self._refresh_task = None
+    
+    async def _fetch_auth_token(self) -> str:
+        """Log in and cache a fresh JWT authentication token."""
         try:
-            url = urljoin(self.base_url, "/api/admin/auth/login")
             payload = {
                 "Username": self.username,
                 "Password": self.password,
             }
             
             response = await self._http.post(
-                url,
-                json=payload,
+                self._auth_url,
+                content=_json_dumps(payload),
+                headers={"Content-Type": "application/json"},
             )
             
             if response.status_code >= 400:
                 raise AuthenticationException("Failed to authenticate with the server.")
             
-            data = response.json()
+            data = _json_loads(response.content)
             token = data.get("token")
             
             if not token:
                 raise AuthenticationException("No token in authentication response.")
             
             self._jwt_token = token
-            # Token expires in 8 hours, refresh after 7 hours
-            import asyncio
-            self._token_expires_at = datetime.now(UTC)
-            # Note: In production, parse the JWT to get actual expiration
-            # For now, assume 8 hours expiration
-            from datetime import timedelta
-            self._token_expires_at += timedelta(hours=7)
+            self._auth_header = f"Bearer {token}"
+            ttl = self._token_ttl_seconds(token)
+            if ttl is None:
+                ttl = _DEFAULT_TOKEN_TTL_SECONDS
+            self._token_expires_at = time.monotonic() + ttl
+            self._token_stale_at = self._token_expires_at - min(_TOKEN_STALE_WINDOW_SECONDS, ttl / 2)
             
             return token
         except Exception as ex:
@@ -234,75 +475,130 @@ class OmnixClient:
         content: Optional[bytes] = None,
         data: Optional[BinaryIO] = None,
         json_data: Optional[Dict] = None,
+        params: Optional[Mapping[str, str]] = None,
     ):
-        """Make authenticated HTTP request."""
-        token = await self._get_auth_token()
-        
-        if headers is None:
-            headers = {}
+        """
+        Make authenticated HTTP request.
+
+        ``params`` are percent-encoded per RFC 3986 (a space becomes ``%20``,
+        never ``+``) and appended to any query string already in ``path``.
+        """
+        if method not in _SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        headers["Authorization"] = f"Bearer {token}"
+        if not self._has_fresh_token():
+            await self._get_auth_token()
+        headers = self._with_auth_header(headers)
         
-        url = urljoin(self.base_url, path)
+        # Paths are built by the SDK and always start with "/", so plain
+        # concatenation is equivalent to urljoin without re-parsing both URLs.
+        assert path.startswith("/"), path
+        url = self._base_url_norm + path
+        if params:
+            url += ("&" if "?" in path else "?") + urlencode(params, quote_via=quote)
         
-        if method == "GET":
-            response = await self._http.get(url, headers=headers)
-        elif method == "HEAD":
-            response = await self._http.head(url, headers=headers)
-        elif method == "PUT":
+        body: Dict[str, object] = {}
+        if method in _BODY_METHODS:
             if data:
-                response = await self._http.put(url, content=data.read(), headers=headers)
+                upload = UploadStream(data, self._chunk_size)
+                if upload.length is None:
+                    # A non-seekable stream can be neither sized nor replayed on
+                    # retry, so buffer it; S3 rejects chunked PUTs without a length.
+                    body["content"] = data.read()
+                else:
+                    if not any(k.lower() == "content-length" for k in headers):
+                        headers["Content-Length"] = str(upload.length)
+                    body["content"] = upload
             elif json_data:
-                response = await self._http.put(url, json=json_data, headers=headers)
+                headers.setdefault("Content-Type", "application/json")
+                body["content"] = _json_dumps(json_data)
             else:
-                response = await self._http.put(url, content=content, headers=headers)
-        elif method == "DELETE":
-            response = await self._http.delete(url, headers=headers)
-        elif method == "POST":
-            if data:
-                response = await self._http.post(url, content=data.read(), headers=headers)
-            elif json_data:
-                response = await self._http.post(url, json=json_data, headers=headers)
-            else:
-                response = await self._http.post(url, content=content, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+                body["content"] = content
         
+        response = await self._http.request(method, url, headers=headers, **body)
+        self._raise_for_status(response)
+        return response
+    
+    @asynccontextmanager
+    async def _make_stream(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Make authenticated HTTP request whose response body is streamed by the caller."""
+        if not self._has_fresh_token():
+            await self._get_auth_token()
+        headers = self._with_auth_header(headers)
+        
+        assert path.startswith("/"), path
+        async with self._http.stream(method, self._base_url_norm + path, headers=headers) as response:
+            self._raise_for_status(response)
+            yield response
+    
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
         if response.status_code >= 400:
             error_msg = f"Request failed with status {response.status_code}"
             if response.status_code == 404:
                 error_msg = "Resource not found"
-            raise ServerException(error_msg, response.status_code)
-        
-        return response
+            raise ServerException(error_msg, response.status_code, OmnixClient._s3_error_code(response))
+    
+    @staticmethod
+    def _s3_error_code(response: httpx.Response) -> Optional[str]:
+        """Return the <Code> of an S3 XML error body, if the body was read and has one."""
+        try:
+            body = response.text
+        except httpx.ResponseNotRead:
+            return None
+        if "<Code>" not in body:
+            return None
+        try:
+            return ET.fromstring(body).findtext("{*}Code") or None
+        except ET.ParseError:
+            return None
     
     # Bucket operations
     
     async def bucket_exists(self, bucket_name: str) -> bool:
-        """Check if a bucket exists."""
+        """Check if a bucket exists.
+
+        Answers are cached briefly per bucket; make_bucket and remove_bucket
+        invalidate the cached entry.
+        """
+        cached = self._bucket_exists_cache.get(bucket_name)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
         try:
-            path = f"/{bucket_name}"
+            path = self._encode_path(bucket_name)
             await self._make_request("HEAD", path)
-            return True
+            exists = True
         except ServerException as e:
-            if e.status_code == 404:
-                return False
-            raise
+            if e.status_code != 404:
+                raise
+            exists = False
+
+        ttl = _BUCKET_EXISTS_TTL_SECONDS if exists else _BUCKET_MISSING_TTL_SECONDS
+        self._bucket_exists_cache[bucket_name] = (exists, time.monotonic() + ttl)
+        return exists
     
     async def make_bucket(self, bucket_name: str) -> None:
         """Create a new bucket."""
-        path = f"/{bucket_name}"
+        path = self._encode_path(bucket_name)
         await self._make_request("PUT", path)
+        self._bucket_exists_cache.pop(bucket_name, None)
     
     async def remove_bucket(self, bucket_name: str) -> None:
         """Remove a bucket (must be empty)."""
-        path = f"/{bucket_name}"
+        path = self._encode_path(bucket_name)
         await self._make_request("DELETE", path)
+        self._bucket_exists_cache.pop(bucket_name, None)
     
     async def list_buckets(self) -> list[Bucket]:
         """List all buckets."""
         response = await self._make_request("GET", "/api/admin/buckets")
-        data = response.json()
+        data = _json_loads(response.content)
         
         buckets = []
         for bucket_data in data.get("buckets", []):
@@ -337,7 +633,7 @@ class OmnixClient:
         if length:
             headers["Content-Length"] = str(length)
         
-        path = f"/{bucket_name}/{object_name}"
+        path = self._encode_path(bucket_name, object_name)
         response = await self._make_request("PUT", path, headers=headers, data=data)
         
         etag = response.headers.get("ETag", "unknown")
@@ -355,21 +651,23 @@ class OmnixClient:
         output: BinaryIO,
     ) -> ObjectMetadata:
         """Download an object from the bucket."""
-        path = f"/{bucket_name}/{object_name}"
+        path = self._encode_path(bucket_name, object_name)
         
+        size = 0
         try:
-            response = await self._make_request("GET", path)
+            async with self._make_stream("GET", path) as response:
+                async for chunk in response.aiter_bytes(self._chunk_size):
+                    output.write(chunk)
+                    size += len(chunk)
         except ServerException as e:
             if e.status_code == 404:
                 raise ObjectNotFoundException(bucket_name, object_name)
             raise
         
-        output.write(response.content)
-        
         return ObjectMetadata(
             object_name=object_name,
             bucket_name=bucket_name,
-            size=len(response.content),
+            size=size,
             content_type=response.headers.get("Content-Type"),
             etag=response.headers.get("ETag", "unknown"),
         )
@@ -380,7 +678,7 @@ class OmnixClient:
         object_name: str,
     ) -> ObjectMetadata:
         """Get object metadata without downloading."""
-        path = f"/{bucket_name}/{object_name}"
+        path = self._encode_path(bucket_name, object_name)
         
         try:
             response = await self._make_request("HEAD", path)
@@ -397,13 +695,25 @@ class OmnixClient:
             etag=response.headers.get("ETag", "unknown"),
         )
     
+    async def stat_objects(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[ObjectMetadata]:
+        """Get metadata for many objects concurrently, in the order of object_names."""
+        return await _gather_bounded(
+            (self.stat_object(bucket_name, name) for name in object_names),
+            concurrency,
+        )
+    
     async def remove_object(
         self,
         bucket_name: str,
         object_name: str,
     ) -> None:
         """Remove an object from the bucket."""
-        path = f"/{bucket_name}/{object_name}"
+        path = self._encode_path(bucket_name, object_name)
         
         try:
             await self._make_request("DELETE", path)
@@ -421,7 +731,7 @@ class OmnixClient:
         metadata: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Optional[str]]:
         """Copy an object to another location."""
-        copy_source = f"/{source_bucket}/{source_object}"
+        copy_source = self._encode_path(source_bucket, source_object)
         headers = {
             "x-amz-copy-source": copy_source,
             "Content-Length": "1",
@@ -432,7 +742,7 @@ class OmnixClient:
             for key, value in metadata.items():
                 headers[f"x-amz-meta-{key}"] = value
 
-        path = f"/{destination_bucket}/{destination_object}"
+        path = self._encode_path(destination_bucket, destination_object)
         response = await self._make_request("PUT", path, headers=headers, content=b"\x00")
 
         etag = response.headers.get("ETag")
@@ -444,30 +754,58 @@ class OmnixClient:
         if body.strip():
             try:
                 doc = ET.fromstring(body)
-                for node in doc.iter():
-                    tag = node.tag.split("}")[-1]
-                    if tag.lower() == "etag" and node.text:
-                        result["etag"] = node.text.strip('"')
-                    elif tag.lower() == "lastmodified" and node.text:
-                        result["last_modified"] = node.text
+                etag = doc.findtext("{*}ETag")
+                if etag:
+                    result["etag"] = etag.strip('"')
+                last_modified = doc.findtext("{*}LastModified")
+                if last_modified:
+                    result["last_modified"] = last_modified
             except ET.ParseError:
                 pass
 
         return result
 
-    async def remove_objects(self, bucket_name: str, object_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
-        """Remove multiple objects using S3 delete XML payload."""
+    async def remove_objects(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        concurrency: int = 4,
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Remove multiple objects using S3 delete XML payloads.
+
+        Keys are sent in batches of at most 1000 (the S3 per-request limit),
+        with up to ``concurrency`` batches in flight at once.
+        """
         if not object_names:
             return {"deleted": [], "errors": []}
 
-        delete_el = ET.Element("Delete")
-        for name in object_names:
-            obj_el = ET.SubElement(delete_el, "Object")
-            key_el = ET.SubElement(obj_el, "Key")
-            key_el.text = name
+        if len(object_names) <= MAX_DELETE_KEYS_PER_REQUEST:
+            return await self._remove_objects_single(bucket_name, object_names)
+
+        batches = [
+            object_names[i:i + MAX_DELETE_KEYS_PER_REQUEST]
+            for i in range(0, len(object_names), MAX_DELETE_KEYS_PER_REQUEST)
+        ]
+        results = await _gather_bounded(
+            (self._remove_objects_single(bucket_name, batch) for batch in batches),
+            concurrency,
+        )
 
-        xml_payload = ET.tostring(delete_el, encoding="utf-8", method="xml")
-        path = f"/{bucket_name}?delete"
+        merged: Dict[str, List[Dict[str, str]]] = {"deleted": [], "errors": []}
+        for result in results:
+            merged["deleted"].extend(result["deleted"])
+            merged["errors"].extend(result["errors"])
+        return merged
+
+    async def _remove_objects_single(self, bucket_name: str, object_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Remove up to 1000 objects with a single S3 delete request."""
+        xml_payload = "".join([
+            "<Delete>",
+            *(f"<Object><Key>{xml_escape(name)}</Key></Object>" for name in object_names),
+            "</Delete>",
+        ]).encode("utf-8")
+        path = f"{self._encode_path(bucket_name)}?delete"
         headers = {"Content-Type": "application/xml"}
         response = await self._make_request("POST", path, headers=headers, content=xml_payload)
 
@@ -479,27 +817,16 @@ class OmnixClient:
 
         try:
             doc = ET.fromstring(body)
-            for node in doc.iter():
-                tag = node.tag.split("}")[-1].lower()
-                if tag == "deleted":
-                    key = ""
-                    for child in list(node):
-                        child_tag = child.tag.split("}")[-1].lower()
-                        if child_tag == "key" and child.text:
-                            key = child.text
-                    if key:
-                        result["deleted"].append({"key": key})
-                elif tag == "error":
-                    item = {"key": "", "code": "", "message": ""}
-                    for child in list(node):
-                        child_tag = child.tag.split("}")[-1].lower()
-                        if child_tag == "key" and child.text:
-                            item["key"] = child.text
-                        elif child_tag == "code" and child.text:
-                            item["code"] = child.text
-                        elif child_tag == "message" and child.text:
-                            item["message"] = child.text
-                    result["errors"].append(item)
+            for node in doc.iterfind("{*}Deleted"):
+                key = node.findtext("{*}Key")
+                if key:
+                    result["deleted"].append({"key": key})
+            for node in doc.iterfind("{*}Error"):
+                result["errors"].append({
+                    "key": node.findtext("{*}Key") or "",
+                    "code": node.findtext("{*}Code") or "",
+                    "message": node.findtext("{*}Message") or "",
+                })
         except ET.ParseError:
             result["deleted"] = [{"key": name} for name in object_names]
 
@@ -513,7 +840,31 @@ class OmnixClient:
         metadata: Optional[Dict[str, str]] = None,
     ) -> Dict[str, str]:
         """Initiate multipart upload and return upload_id."""
-        path = f"/{bucket_name}/{object_name}?uploads"
+        upload_id = await self._initiate_multipart(self._encode_path(bucket_name, object_name), content_type, metadata)
+        return {"upload_id": upload_id}
+
+    async def open_multipart_upload(
+        self,
+        bucket_name: str,
+        object_name: str,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> MultipartUpload:
+        """
+        Initiate multipart upload and return a handle for the session methods.
+
+        The object path is encoded once here instead of on every part upload.
+        """
+        path = self._encode_path(bucket_name, object_name)
+        upload_id = await self._initiate_multipart(path, content_type, metadata)
+        return MultipartUpload(bucket_name=bucket_name, object_name=object_name, upload_id=upload_id, path=path)
+
+    async def _initiate_multipart(
+        self,
+        path: str,
+        content_type: str,
+        metadata: Optional[Dict[str, str]],
+    ) -> str:
         headers = {
             "Content-Type": content_type,
             "Content-Length": "1",
@@ -522,21 +873,17 @@ class OmnixClient:
             for key, value in metadata.items():
                 headers[f"x-amz-meta-{key}"] = value
 
-        response = await self._make_request("POST", path, headers=headers, content=b"\x00")
+        response = await self._make_request("POST", f"{path}?uploads", headers=headers, content=b"\x00")
         body = response.text or ""
         if not body.strip():
             raise ServerException("Multipart upload initiation did not return an upload ID.", response.status_code)
 
         try:
             doc = ET.fromstring(body)
-            upload_id = ""
-            for node in doc.iter():
-                if node.tag.split("}")[-1].lower() == "uploadid" and node.text:
-                    upload_id = node.text
-                    break
+            upload_id = doc.findtext("{*}UploadId")
             if not upload_id:
                 raise ServerException("Multipart upload initiation did not return an upload ID.", response.status_code)
-            return {"upload_id": upload_id}
+            return upload_id
         except ET.ParseError as ex:
             raise ServerException(f"Failed to parse multipart upload initiation response. {str(ex)}", response.status_code)
 
@@ -549,8 +896,26 @@ class OmnixClient:
         data: BinaryIO,
     ) -> Dict[str, Optional[str]]:
         """Upload one multipart part."""
-        path = f"/{bucket_name}/{object_name}?partNumber={part_number}&uploadId={quote(upload_id, safe='')}"
-        response = await self._make_request("PUT", path, data=data)
+        return await self._upload_part(self._encode_path(bucket_name, object_name), upload_id, part_number, data)
+
+    async def upload_session_part(
+        self,
+        upload: MultipartUpload,
+        part_number: int,
+        data: BinaryIO,
+    ) -> Dict[str, Optional[str]]:
+        """Upload one part of a multipart upload opened with open_multipart_upload."""
+        return await self._upload_part(upload.path, upload.upload_id, part_number, data)
+
+    async def _upload_part(
+        self,
+        path: str,
+        upload_id: str,
+        part_number: int,
+        data: BinaryIO,
+    ) -> Dict[str, Optional[str]]:
+        params = {"partNumber": str(part_number), "uploadId": upload_id}
+        response = await self._make_request("PUT", path, data=data, params=params)
         etag = response.headers.get("ETag", "").strip('"')
         return {"part_number": str(part_number), "etag": etag or None}
 
@@ -562,33 +927,54 @@ class OmnixClient:
         parts: List[Dict[str, str]],
     ) -> Dict[str, Optional[str]]:
         """Complete multipart upload with part list."""
-        path = f"/{bucket_name}/{object_name}?uploadId={quote(upload_id, safe='')}"
+        return await self._complete_multipart(self._encode_path(bucket_name, object_name), upload_id, parts)
+
+    async def complete_upload_session(
+        self,
+        upload: MultipartUpload,
+        parts: List[Dict[str, str]],
+    ) -> Dict[str, Optional[str]]:
+        """Complete a multipart upload opened with open_multipart_upload."""
+        return await self._complete_multipart(upload.path, upload.upload_id, parts)
 
-        root = ET.Element("CompleteMultipartUpload")
+    async def _complete_multipart(
+        self,
+        path: str,
+        upload_id: str,
+        parts: List[Dict[str, str]],
+    ) -> Dict[str, Optional[str]]:
+        # The document shape is fixed, so build it as one string rather than an
+        # element tree; only the text values need escaping.
+        chunks = ["<CompleteMultipartUpload>"]
         for part in parts:
-            part_el = ET.SubElement(root, "Part")
-            num_el = ET.SubElement(part_el, "PartNumber")
-            num_el.text = str(part["part_number"])
-            etag_el = ET.SubElement(part_el, "ETag")
-            etag_value = part["etag"]
+            etag_value = part["etag"] or ""
             if etag_value and not etag_value.startswith('"'):
                 etag_value = f'"{etag_value}"'
-            etag_el.text = etag_value
-
-        payload = ET.tostring(root, encoding="utf-8", method="xml")
-        response = await self._make_request("POST", path, headers={"Content-Type": "application/xml"}, content=payload)
+            chunks.append(
+                f"<Part><PartNumber>{xml_escape(str(part['part_number']))}</PartNumber>"
+                f"<ETag>{xml_escape(etag_value)}</ETag></Part>"
+            )
+        chunks.append("</CompleteMultipartUpload>")
+        payload = "".join(chunks).encode("utf-8")
+        response = await self._make_request(
+            "POST",
+            path,
+            headers={"Content-Type": "application/xml"},
+            content=payload,
+            params={"uploadId": upload_id},
+        )
         body = response.text or ""
 
         result = {"etag": None, "location": None}
         if body.strip():
             try:
                 doc = ET.fromstring(body)
-                for node in doc.iter():
-                    tag = node.tag.split("}")[-1].lower()
-                    if tag == "etag" and node.text:
-                        result["etag"] = node.text.strip('"')
-                    elif tag == "location" and node.text:
-                        result["location"] = node.text
+                etag = doc.findtext("{*}ETag")
+                if etag:
+                    result["etag"] = etag.strip('"')
+                location = doc.findtext("{*}Location")
+                if location:
+                    result["location"] = location
             except ET.ParseError:
                 pass
 
@@ -604,8 +990,12 @@ class OmnixClient:
         upload_id: str,
     ) -> None:
         """Abort multipart upload."""
-        path = f"/{bucket_name}/{object_name}?uploadId={quote(upload_id, safe='')}"
-        await self._make_request("DELETE", path)
+        path = self._encode_path(bucket_name, object_name)
+        await self._make_request("DELETE", path, params={"uploadId": upload_id})
+
+    async def abort_upload_session(self, upload: MultipartUpload) -> None:
+        """Abort a multipart upload opened with open_multipart_upload."""
+        await self._make_request("DELETE", upload.path, params={"uploadId": upload.upload_id})
     
     async def list_objects(
         self,
@@ -626,27 +1016,20 @@ class OmnixClient:
         if continuation_token:
             query_params["continuation-token"] = continuation_token
         
-        query_string = "&".join(
-            f"{k}={v}" for k, v in query_params.items()
-        )
-        path = f"/{bucket_name}"
-        if query_string:
-            path += f"?{query_string}"
-        
-        response = await self._make_request("GET", path)
-        data = response.json()
+        path = self._encode_path(bucket_name)
+        response = await self._make_request("GET", path, params=query_params)
+        data = _json_loads(response.content)
         
-        objects = []
-        for obj in data.get("contents", []):
-            objects.append(
-                ObjectMetadata(
-                    object_name=obj["key"],
-                    bucket_name=bucket_name,
-                    size=obj["size"],
-                    etag=obj.get("etag", "unknown"),
-                    last_modified=datetime.fromisoformat(obj["lastModified"]),
-                )
+        objects = [
+            ObjectMetadataLite(
+                obj["key"],
+                bucket_name,
+                obj["size"],
+                obj.get("etag", "unknown"),
+                datetime.fromisoformat(obj["lastModified"]),
             )
+            for obj in data.get("contents", [])
+        ]
         
         return ListObjectsResult(
             objects=objects,
@@ -665,30 +1048,42 @@ class OmnixClient:
         """Generate a presigned GET URL using local AWS SigV4 signing."""
         self._validate_expiry(expires_in_seconds)
 
-        base_url = self._effective_presigned_base_url(browser_accessible)
-        parsed_base = urlparse(base_url)
-        host = parsed_base.netloc
+        # Only browser-accessible URLs are cached, so internal-host URLs are
+        # never served from the cache.
+        cache_key = ("GET", bucket_name, object_name, None, expires_in_seconds)
+        if browser_accessible:
+            cached = self._get_cached_presigned_url(cache_key, expires_in_seconds)
+            if cached is not None:
+                return cached
+
+        host, use_https = self._effective_presign_context(browser_accessible)
         if not host:
             raise ValueError("Invalid endpoint configuration for presigned URL generation.")
 
         encoded_object = quote(object_name, safe="")
         path = f"/{bucket_name}/{encoded_object}"
+        # Sign and compute expires_at from one clock read so they agree exactly.
+        signed_at = datetime.fromtimestamp(int(time.time()), UTC)
 
         url = self._signer.generate_presigned_url(
             method="GET",
             host=host,
             path=path,
             expires_in_seconds=expires_in_seconds,
-            use_https=(parsed_base.scheme.lower() == "https"),
+            use_https=use_https,
+            timestamp=signed_at,
         )
 
         if browser_accessible:
             url = self._validate_and_log_presigned_url(url, expires_in_seconds, bucket_name, object_name)
 
-        return PresignedUrlResult(
+        result = PresignedUrlResult(
             url=url,
-            expires_at=datetime.now(UTC) + timedelta(seconds=int(expires_in_seconds)),
+            expires_at=signed_at + timedelta(seconds=int(expires_in_seconds)),
         )
+        if browser_accessible:
+            self._store_presigned_url(cache_key, result, expires_in_seconds)
+        return result
 
     async def presigned_put_object(
         self,
@@ -701,14 +1096,20 @@ class OmnixClient:
         """Generate a presigned PUT URL using local AWS SigV4 signing."""
         self._validate_expiry(expires_in_seconds)
 
-        base_url = self._effective_presigned_base_url(browser_accessible)
-        parsed_base = urlparse(base_url)
-        host = parsed_base.netloc
+        cache_key = ("PUT", bucket_name, object_name, content_type, expires_in_seconds)
+        if browser_accessible:
+            cached = self._get_cached_presigned_url(cache_key, expires_in_seconds)
+            if cached is not None:
+                return cached
+
+        host, use_https = self._effective_presign_context(browser_accessible)
         if not host:
             raise ValueError("Invalid endpoint configuration for presigned URL generation.")
 
         encoded_object = quote(object_name, safe="")
         path = f"/{bucket_name}/{encoded_object}"
+        # Sign and compute expires_at from one clock read so they agree exactly.
+        signed_at = datetime.fromtimestamp(int(time.time()), UTC)
 
         query_params: Dict[str, str] = {}
         if content_type:
@@ -720,30 +1121,125 @@ class OmnixClient:
             path=path,
             query_params=query_params,
             expires_in_seconds=expires_in_seconds,
-            use_https=(parsed_base.scheme.lower() == "https"),
+            use_https=use_https,
+            timestamp=signed_at,
         )
 
         if browser_accessible:
             url = self._validate_and_log_presigned_url(url, expires_in_seconds, bucket_name, object_name)
         
-        return PresignedUrlResult(
+        result = PresignedUrlResult(
             url=url,
-            expires_at=datetime.now(UTC) + timedelta(seconds=int(expires_in_seconds)),
+            expires_at=signed_at + timedelta(seconds=int(expires_in_seconds)),
         )
+        if browser_accessible:
+            self._store_presigned_url(cache_key, result, expires_in_seconds)
+        return result
+
+    async def presigned_get_objects(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        expires_in_seconds: int = 3600,
+        browser_accessible: bool = True,
+    ) -> List[PresignedUrlResult]:
+        """
+        Generate presigned GET URLs for many objects, in the order of object_names.
+
+        Signing is local, so the batch resolves the endpoint, reads the clock and
+        validates the host once, then only signs each object path.
+        """
+        self._validate_expiry(expires_in_seconds)
+
+        host, use_https = self._effective_presign_context(browser_accessible)
+        if not host:
+            raise ValueError("Invalid endpoint configuration for presigned URL generation.")
+
+        signed_at = datetime.fromtimestamp(int(time.time()), UTC)
+        expires_at = signed_at + timedelta(seconds=int(expires_in_seconds))
+        host_checked = not browser_accessible
+
+        results: List[PresignedUrlResult] = []
+        for object_name in object_names:
+            cache_key = ("GET", bucket_name, object_name, None, expires_in_seconds)
+            if browser_accessible:
+                cached = self._get_cached_presigned_url(cache_key, expires_in_seconds)
+                if cached is not None:
+                    results.append(cached)
+                    continue
+
+            url = self._signer.generate_presigned_url(
+                method="GET",
+                host=host,
+                path=f"/{bucket_name}/{quote(object_name, safe='')}",
+                expires_in_seconds=expires_in_seconds,
+                use_https=use_https,
+                timestamp=signed_at,
+            )
+            if not host_checked:
+                self._validate_presigned_url_host(url)
+                host_checked = True
+
+            result = PresignedUrlResult(url=url, expires_at=expires_at)
+            if browser_accessible:
+                self._store_presigned_url(cache_key, result, expires_in_seconds)
+            results.append(result)
+
+        if browser_accessible and self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "[OmnixStorage][PresignedUrl] host=%s configuredPublicHost=%s expirySeconds=%s bucket=%s count=%s",
+                host,
+                self._public_host,
+                expires_in_seconds,
+                bucket_name,
+                len(results),
+            )
+        return results
 
     async def ensure_bucket_exists(self, bucket_name: str, max_attempts: int = 3, delay_seconds: int = 2) -> None:
-        """Ensure a bucket exists with retries (parity helper with .NET extensions)."""
-        import asyncio
+        """
+        Ensure a bucket exists with retries (parity helper with .NET extensions).
 
+        Issues a single create request per attempt. A 409 Conflict counts as
+        success only when the bucket is ours: either the server reports
+        BucketAlreadyOwnedByYou, or, for other conflicts, a follow-up
+        bucket_exists() check confirms access (a bucket owned by another
+        account fails that check). A 403 on create is also accepted when
+        bucket_exists() confirms the bucket, so credentials that may use but
+        not create buckets still succeed. BucketAlreadyExists is raised as
+        BucketAlreadyExistsException. Only transient failures (network
+        errors, 5xx responses and unconfirmed conflicts such as
+        OperationAborted) are retried.
+        """
         last_error: Optional[Exception] = None
         for attempt in range(1, max_attempts + 1):
             try:
-                if await self.bucket_exists(bucket_name):
-                    return
                 await self.make_bucket(bucket_name)
-                if await self.bucket_exists(bucket_name):
-                    return
-            except Exception as ex:
+                return
+            except ServerException as ex:
+                if ex.status_code == 409:
+                    if ex.error_code == "BucketAlreadyOwnedByYou":
+                        return
+                    if ex.error_code == "BucketAlreadyExists":
+                        raise BucketAlreadyExistsException(bucket_name) from ex
+                    self._bucket_exists_cache.pop(bucket_name, None)
+                    if await self.bucket_exists(bucket_name):
+                        return
+                    last_error = ex
+                elif ex.status_code == 403:
+                    self._bucket_exists_cache.pop(bucket_name, None)
+                    try:
+                        exists = await self.bucket_exists(bucket_name)
+                    except ServerException:
+                        exists = False
+                    if exists:
+                        return
+                    raise
+                elif ex.status_code is None or ex.status_code < 500:
+                    raise
+                else:
+                    last_error = ex
+            except httpx.RequestError as ex:
                 last_error = ex
 
             if attempt < max_attempts:
@@ -773,7 +1269,18 @@ class OmnixClient:
     
     async def close(self) -> None:
         """Close the client and cleanup resources."""
-        await self._http.close()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self._owns_http:
+            await self._http.close()
+        elif self._shares_http:
+            self._shares_http = False
+            refs = _shared_http_refs.get(self._http, 1) - 1
+            if refs > 0:
+                _shared_http_refs[self._http] = refs
+            else:
+                _shared_http_refs.pop(self._http, None)
+                await self._http.close()
     
     async def __aenter__(self):
         return self
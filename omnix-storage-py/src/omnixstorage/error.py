@@ -1,7 +1,22 @@
 """
 Exception classes for OmnixStorage SDK
+
+Exceptions raised for a named bucket or object keep the names and build
+their message only when it is rendered with str().
 """
 
+# HTTP status and S3 error codes attached by the fixed-code exceptions below.
+_STATUS_UNAUTHORIZED = 401
+_STATUS_FORBIDDEN = 403
+_STATUS_NOT_FOUND = 404
+_STATUS_CONFLICT = 409
+
+_CODE_NO_SUCH_BUCKET = "NoSuchBucket"
+_CODE_BUCKET_ALREADY_EXISTS = "BucketAlreadyExists"
+_CODE_NO_SUCH_KEY = "NoSuchKey"
+_CODE_INVALID_CREDENTIALS = "InvalidCredentials"
+_CODE_ACCESS_DENIED = "AccessDenied"
+
 
 class OmnixStorageException(Exception):
     """
@@ -18,66 +33,69 @@ class BucketNotFoundException(OmnixStorageException):
     """Thrown when a bucket is not found."""
     
     def __init__(self, bucket_name: str):
-        super().__init__(
-            f"Bucket '{bucket_name}' not found.",
-            status_code=404,
-            error_code="NoSuchBucket"
-        )
+        OmnixStorageException.__init__(self, bucket_name, _STATUS_NOT_FOUND, _CODE_NO_SUCH_BUCKET)
+        self.bucket_name = bucket_name
+    
+    def __str__(self) -> str:
+        return f"Bucket '{self.bucket_name}' not found."
 
 
 class BucketAlreadyExistsException(OmnixStorageException):
     """Thrown when trying to create a bucket that already exists."""
     
     def __init__(self, bucket_name: str):
-        super().__init__(
-            f"Bucket '{bucket_name}' already exists.",
-            status_code=409,
-            error_code="BucketAlreadyExists"
-        )
+        OmnixStorageException.__init__(self, bucket_name, _STATUS_CONFLICT, _CODE_BUCKET_ALREADY_EXISTS)
+        self.bucket_name = bucket_name
+    
+    def __str__(self) -> str:
+        return f"Bucket '{self.bucket_name}' already exists."
 
 
 class ObjectNotFoundException(OmnixStorageException):
     """Thrown when an object is not found."""
     
     def __init__(self, bucket_name: str, object_name: str):
-        super().__init__(
-            f"Object '{object_name}' not found in bucket '{bucket_name}'.",
-            status_code=404,
-            error_code="NoSuchKey"
-        )
+        OmnixStorageException.__init__(self, object_name, _STATUS_NOT_FOUND, _CODE_NO_SUCH_KEY)
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+    
+    def __reduce__(self):
+        return (self.__class__, (self.bucket_name, self.object_name), self.__dict__)
+    
+    def __str__(self) -> str:
+        return f"Object '{self.object_name}' not found in bucket '{self.bucket_name}'."
 
 
 class InvalidObjectNameException(OmnixStorageException):
     """Thrown when an object name is invalid."""
     
     def __init__(self, object_name: str):
-        super().__init__(f"Object name '{object_name}' is invalid.")
+        OmnixStorageException.__init__(self, object_name)
+        self.object_name = object_name
+    
+    def __str__(self) -> str:
+        return f"Object name '{self.object_name}' is invalid."
 
 
 class AuthenticationException(OmnixStorageException):
     """Thrown when authentication fails."""
     
     def __init__(self, message: str):
-        super().__init__(
-            message,
-            status_code=401,
-            error_code="InvalidCredentials"
-        )
+        OmnixStorageException.__init__(self, message, _STATUS_UNAUTHORIZED, _CODE_INVALID_CREDENTIALS)
 
 
 class ServerException(OmnixStorageException):
     """Thrown when the server returns an error."""
     
     def __init__(self, message: str, status_code: int, error_code: str = None):
-        super().__init__(message, status_code, error_code)
+        OmnixStorageException.__init__(self, message, status_code, error_code)
+    
+    def __reduce__(self):
+        return (self.__class__, (self.args[0], self.status_code, self.error_code), self.__dict__)
 
 
 class AccessDeniedException(OmnixStorageException):
     """Thrown when access is denied."""
     
     def __init__(self, message: str):
-        super().__init__(
-            message,
-            status_code=403,
-            error_code="AccessDenied"
-        )
+        OmnixStorageException.__init__(self, message, _STATUS_FORBIDDEN, _CODE_ACCESS_DENIED)
@@ -1,20 +1,28 @@
 """
 Data models for OmnixStorage SDK
+
+Most models are slotted dataclasses. The generated __init__ is compiled once
+at import and constructs instances as fast as a hand-written slotted class,
+so dataclasses are kept for their equality, repr and asdict() support.
+
+Two models are not dataclasses: list rows are ObjectMetadataLite named
+tuples, and PresignedUrlResult is a str subclass, so asdict() and replace()
+do not apply to it and its equality compares the URL only, not expires_at.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, NamedTuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Bucket:
     """Represents a bucket in OmnixStorage."""
     name: str
     creation_date: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectMetadata:
     """Represents object metadata."""
     object_name: str
@@ -26,16 +34,25 @@ class ObjectMetadata:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+class ObjectMetadataLite(NamedTuple):
+    """Per-object row of a list objects response; use stat_object for full metadata."""
+    object_name: str
+    bucket_name: str
+    size: int
+    etag: Optional[str]
+    last_modified: Optional[datetime]
+
+
+@dataclass(slots=True)
 class ListObjectsResult:
     """Represents the result of a list objects operation."""
-    objects: List[ObjectMetadata] = field(default_factory=list)
+    objects: List[ObjectMetadataLite] = field(default_factory=list)
     is_truncated: bool = False
     continuation_token: Optional[str] = None
     common_prefixes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PutObjectResult:
     """Represents the result of a put object operation."""
     bucket_name: str
@@ -44,14 +61,48 @@ class PutObjectResult:
     version_id: Optional[str] = None
 
 
-@dataclass
-class PresignedUrlResult:
-    """Represents a presigned URL response."""
-    url: str
+class PresignedUrlResult(str):
+    """Represents a presigned URL response.
+
+    The result is the URL string itself, so it can be used wherever a URL is
+    expected; ``url`` returns it as a plain ``str``. Immutable because the
+    client hands the same cached instance to every caller.
+    """
     expires_at: datetime
 
+    def __new__(cls, url: str, expires_at: datetime) -> "PresignedUrlResult":
+        self = str.__new__(cls, url)
+        object.__setattr__(self, "expires_at", expires_at)
+        return self
+
+    @property
+    def url(self) -> str:
+        return str.__str__(self)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getnewargs__(self):
+        return (str.__str__(self), self.expires_at)
+
+    def __repr__(self) -> str:
+        return f"PresignedUrlResult(url={str.__repr__(self)}, expires_at={self.expires_at!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class MultipartUpload:
+    """Represents an in-progress multipart upload returned by open_multipart_upload."""
+    bucket_name: str
+    object_name: str
+    upload_id: str
+    # Percent-encoded object path, computed once for every part request.
+    path: str = field(repr=False, compare=False)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BucketPolicyResult:
     """Represents bucket policy information."""
     bucket_name: str
@@ -0,0 +1,61 @@
+import re
+
+import pytest
+import pytest_asyncio
+
+from omnixstorage.client import OmnixClient
+
+
+ENDPOINT = "storage.kegeosapps.com:443"
+PUBLIC_ENDPOINT = "https://storage-public.kegeosapps.com"
+ACCESS_KEY = "AKIATESAFEKEY0000001"
+SECRET_KEY = "wJalrXUtnFEMIaKkMDENGbPxRfIcxAmPlEkEyZaB"
+
+
+# Sorted SigV4 query parameters, with the signature appended last.
+_SIGV4_QUERY_RE = re.compile(
+    r"X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Credential=[^&]+&X-Amz-Date=\d{8}T\d{6}Z"
+    r"&X-Amz-Expires=\d+&X-Amz-SignedHeaders=host(?:&[^&]+)*&X-Amz-Signature=[0-9a-f]{64}$"
+)
+
+
+@pytest.fixture(scope="session")
+def assert_sigv4_url():
+    """Return a checker asserting a presigned URL carries every SigV4 query parameter."""
+    def check(url: str) -> None:
+        assert _SIGV4_QUERY_RE.search(url), url
+
+    return check
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_client():
+    """One client, and so one connection pool, for every test in the session.
+
+    Tests using it must run on the session event loop
+    (``@pytest.mark.asyncio(loop_scope="session")``) because pooled
+    connections are bound to the loop that opened them.
+    """
+    client = OmnixClient(
+        endpoint=ENDPOINT,
+        public_endpoint=PUBLIC_ENDPOINT,
+        access_key=ACCESS_KEY,
+        secret_key=SECRET_KEY,
+        use_ssl=True,
+    )
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def internal_public_client():
+    """Client whose public endpoint is an internal address, for guardrail tests."""
+    client = OmnixClient(
+        endpoint=ENDPOINT,
+        public_endpoint="http://127.0.0.1:9000",
+        access_key=ACCESS_KEY,
+        secret_key=SECRET_KEY,
+        use_ssl=True,
+    )
+    yield client
+    await client.close()
@@ -0,0 +1,657 @@
+import asyncio
+import base64
+import io
+import json
+import time
+from datetime import UTC, datetime
+import xml.etree.ElementTree as ET
+
+import httpx
+import pytest
+
+from omnixstorage.client import OmnixClient
+from omnixstorage.models import ObjectMetadataLite
+from omnixstorage.error import (
+    AuthenticationException,
+    BucketAlreadyExistsException,
+    ObjectNotFoundException,
+    ServerException,
+)
+
+
+def _client_with(handler) -> OmnixClient:
+    """Build a client whose HTTP traffic is served by ``handler``; auth is answered automatically."""
+    def dispatch(request):
+        if request.url.path == "/api/admin/auth/login":
+            return httpx.Response(200, json={"token": "test-token"})
+        return handler(request)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_object_paths_are_percent_encoded():
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.raw_path.decode(), request.headers.get("x-amz-copy-source")))
+        return httpx.Response(200, headers={"ETag": '"abc"'})
+
+    client = _client_with(handler)
+    await client.put_object("bucket", "dir/my file+1?.txt", io.BytesIO(b"data"))
+    await client.copy_object("bucket", "dir/é.txt", "bucket", "copy #1.txt")
+
+    assert seen == [
+        ("PUT", "/bucket/dir/my%20file%2B1%3F.txt", None),
+        ("PUT", "/bucket/copy%20%231.txt", "/bucket/dir/%C3%A9.txt"),
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_list_objects_encodes_query_parameters():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.query.decode())
+        return httpx.Response(200, json={"contents": [], "isTruncated": False})
+
+    client = _client_with(handler)
+    await client.list_objects("bucket", prefix="a&b=c d/", continuation_token="tok/+=")
+
+    assert seen == ["prefix=a%26b%3Dc%20d%2F&max-keys=1000&continuation-token=tok%2F%2B%3D"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_list_objects_returns_lightweight_rows():
+    def handler(request):
+        return httpx.Response(200, json={
+            "contents": [{"key": "a.txt", "size": 3, "etag": "e1", "lastModified": "2024-01-02T03:04:05+00:00"}],
+            "isTruncated": True,
+            "continuationToken": "next",
+        })
+
+    client = _client_with(handler)
+    listing = await client.list_objects("bucket")
+
+    [row] = listing.objects
+    assert row == ObjectMetadataLite("a.txt", "bucket", 3, "e1", datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC))
+    assert row.object_name == "a.txt" and row.size == 3
+    assert listing.is_truncated and listing.continuation_token == "next"
+    await client.close()
+
+
+def _jwt(payload: dict) -> str:
+    segment = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{segment}.signature"
+
+
+def test_token_ttl_uses_exp_claim():
+    ttl = OmnixClient._token_ttl_seconds(_jwt({"sub": "admin", "exp": time.time() + 900}))
+
+    assert 830 < ttl <= 840
+    assert OmnixClient._token_ttl_seconds(_jwt({"exp": time.time() - 10})) is None
+    assert OmnixClient._token_ttl_seconds(_jwt({"sub": "admin"})) is None
+    assert OmnixClient._token_ttl_seconds("not-a-jwt") is None
+
+
+def test_token_ttl_scales_skew_for_short_lived_tokens():
+    now = time.time()
+
+    assert 26 < OmnixClient._token_ttl_seconds(_jwt({"iat": now, "exp": now + 30})) <= 27
+    assert OmnixClient._token_ttl_seconds(_jwt({"iat": now - 28, "exp": now + 2})) == 5.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exp_offset", [30, -120], ids=["short-lived", "clock-ahead"])
+async def test_short_lived_or_skewed_tokens_do_not_log_in_per_request(exp_offset):
+    logins = []
+
+    def handler(request):
+        if request.url.path == "/api/admin/auth/login":
+            logins.append(request)
+            now = time.time()
+            return httpx.Response(200, json={"token": _jwt({"iat": now, "exp": now + exp_offset})})
+        return httpx.Response(200)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    for i in range(5):
+        await client.bucket_exists(f"bucket-{i}")
+
+    assert len(logins) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_make_request_does_not_mutate_caller_headers():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(200)
+
+    client = _client_with(handler)
+    headers = {"Content-Type": "text/plain"}
+    await client._make_request("GET", "/bucket", headers=headers)
+
+    assert headers == {"Content-Type": "text/plain"}
+    assert seen == ["Bearer test-token"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_login():
+    logins = []
+
+    async def handler(request):
+        if request.url.path == "/api/admin/auth/login":
+            logins.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"token": "test-token"})
+        return httpx.Response(200)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await asyncio.gather(*(client._make_request("HEAD", "/bucket") for _ in range(10)))
+
+    assert len(logins) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_clients_reuse_http_pool_until_last_close():
+    first = OmnixClient.from_shared(endpoint="shared.test", access_key="AKIAXXX", secret_key="SECRET")
+    second = OmnixClient.from_shared(endpoint="shared.test", access_key="AKIAYYY", secret_key="SECRET")
+    other = OmnixClient.from_shared(endpoint="shared.test", use_ssl=True)
+
+    assert first._http is second._http
+    assert other._http is not first._http
+
+    await first.close()
+    await first.close()  # closing twice must not release the pool early
+    assert not second._http._client.is_closed
+
+    await second.close()
+    assert second._http._client.is_closed
+    await other.close()
+    assert other._http._client.is_closed
+
+    replacement = OmnixClient.from_shared(endpoint="shared.test")
+    assert replacement._http is not first._http
+    await replacement.close()
+
+
+@pytest.mark.asyncio
+async def test_get_object_streams_body_into_output():
+    body = b"0123456789" * 1000
+
+    def handler(request):
+        if request.url.path.endswith("/missing.bin"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=body, headers={"ETag": '"abc"', "Content-Type": "application/octet-stream"})
+
+    client = _client_with(handler)
+    output = io.BytesIO()
+    meta = await client.get_object("bucket", "data.bin", output)
+
+    assert output.getvalue() == body
+    assert meta.size == len(body)
+    assert meta.etag == '"abc"'
+
+    with pytest.raises(ObjectNotFoundException):
+        await client.get_object("bucket", "missing.bin", io.BytesIO())
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stat_objects_limits_concurrency_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        if request.url.path == "/api/admin/auth/login":
+            return httpx.Response(200, json={"token": "test-token"})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        size = len(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, headers={"Content-Length": str(size)})
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    names = ["a" * n for n in range(1, 21)]
+
+    results = await client.stat_objects("bucket", names, concurrency=4)
+
+    assert [r.object_name for r in results] == names
+    assert [r.size for r in results] == list(range(1, 21))
+    assert peak <= 4
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_login_releases_lock_and_expired_token_refreshes_once():
+    responses = iter([httpx.Response(500), httpx.Response(200, json={"token": "fresh-token"})])
+    logins = []
+
+    def handler(request):
+        if request.url.path == "/api/admin/auth/login":
+            logins.append(request)
+            return next(responses)
+        return httpx.Response(200)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET", max_retries=1)
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(AuthenticationException):
+        await client._make_request("HEAD", "/bucket")
+    assert not client._auth_lock.locked()
+
+    client._jwt_token = "stale-token"
+    client._token_expires_at = time.monotonic() - 1
+    await asyncio.gather(*(client._make_request("HEAD", "/bucket") for _ in range(5)))
+
+    assert len(logins) == 2
+    assert client._auth_header == "Bearer fresh-token"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_token_is_served_while_refreshing_in_background():
+    seen = []
+    logins = []
+
+    async def handler(request):
+        if request.url.path == "/api/admin/auth/login":
+            logins.append(request)
+            return httpx.Response(200, json={"token": "fresh-token"})
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._jwt_token = "stale-token"
+    client._auth_header = "Bearer stale-token"
+    client._token_expires_at = time.monotonic() + 300
+    client._token_stale_at = time.monotonic() - 1
+
+    await client._make_request("HEAD", "/bucket")
+    assert seen == ["Bearer stale-token"]
+
+    await client._refresh_task
+    await client._make_request("HEAD", "/bucket")
+
+    assert len(logins) == 1
+    assert seen[-1] == "Bearer fresh-token"
+    assert client._refresh_task is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_backs_off():
+    logins = []
+
+    async def handler(request):
+        if request.url.path == "/api/admin/auth/login":
+            logins.append(request)
+            return httpx.Response(401)
+        return httpx.Response(200)
+
+    client = OmnixClient(endpoint="storage.test", access_key="AKIAXXX", secret_key="SECRET")
+    client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._jwt_token = "stale-token"
+    client._auth_header = "Bearer stale-token"
+    client._token_expires_at = time.monotonic() + 300
+    client._token_stale_at = time.monotonic() - 1
+
+    await client._make_request("HEAD", "/bucket")
+    await client._refresh_task
+    for _ in range(5):
+        await client._make_request("HEAD", "/bucket")
+
+    assert len(logins) == 1
+    assert client._refresh_task is None
+
+    client._refresh_retry_at = time.monotonic() - 1
+    await client._make_request("HEAD", "/bucket")
+    await client._refresh_task
+    assert len(logins) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_bucket_exists_is_cached_and_invalidated_by_make_bucket():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "HEAD":
+            return httpx.Response(404 if calls.count("PUT") == 0 else 200)
+        return httpx.Response(200)
+
+    client = _client_with(handler)
+
+    assert await client.bucket_exists("bucket") is False
+    assert await client.bucket_exists("bucket") is False
+    await client.make_bucket("bucket")
+    assert await client.bucket_exists("bucket") is True
+    assert await client.bucket_exists("bucket") is True
+
+    assert calls == ["HEAD", "PUT", "HEAD"]
+    await client.close()
+
+
+def _s3_error(status: int, code: str) -> httpx.Response:
+    return httpx.Response(status, text=f"<Error><Code>{code}</Code><Message>conflict</Message></Error>")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "create_response",
+    [httpx.Response(200), _s3_error(409, "BucketAlreadyOwnedByYou")],
+    ids=["created", "already-owned"],
+)
+async def test_ensure_bucket_exists_is_a_single_create_request(create_response):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return create_response
+
+    client = _client_with(handler)
+    await client.ensure_bucket_exists("bucket", delay_seconds=0)
+
+    assert calls == ["PUT"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_ensure_bucket_exists_raises_when_name_is_taken_by_another_account():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return _s3_error(409, "BucketAlreadyExists")
+
+    client = _client_with(handler)
+    with pytest.raises(BucketAlreadyExistsException):
+        await client.ensure_bucket_exists("bucket", delay_seconds=0)
+
+    assert calls == ["PUT"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("head_status, succeeds", [(200, True), (403, False)])
+async def test_ensure_bucket_exists_confirms_uncoded_conflicts(head_status, succeeds):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(409 if request.method == "PUT" else head_status)
+
+    client = _client_with(handler)
+    if succeeds:
+        await client.ensure_bucket_exists("bucket", delay_seconds=0)
+    else:
+        with pytest.raises(ServerException) as excinfo:
+            await client.ensure_bucket_exists("bucket", delay_seconds=0)
+        assert excinfo.value.status_code == 403
+
+    assert calls == ["PUT", "HEAD"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "head_status, succeeds",
+    [(200, True), (403, False), (404, False)],
+    ids=["readable", "forbidden", "missing"],
+)
+async def test_ensure_bucket_exists_confirms_forbidden_create(head_status, succeeds):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(403 if request.method == "PUT" else head_status)
+
+    client = _client_with(handler)
+    if succeeds:
+        await client.ensure_bucket_exists("bucket", delay_seconds=0)
+    else:
+        with pytest.raises(ServerException) as excinfo:
+            await client.ensure_bucket_exists("bucket", delay_seconds=0)
+        assert excinfo.value.status_code == 403
+
+    assert calls == ["PUT", "HEAD"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_ensure_bucket_exists_does_not_retry_client_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(400)
+
+    client = _client_with(handler)
+    with pytest.raises(ServerException):
+        await client.ensure_bucket_exists("bucket", delay_seconds=0)
+
+    assert calls == ["PUT"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_put_object_streams_file_with_content_length():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers.get("Content-Length"), request.content))
+        return httpx.Response(200, headers={"ETag": '"abc"'})
+
+    client = _client_with(handler)
+    client._chunk_size = 3
+    result = await client.put_object("bucket", "file.bin", io.BytesIO(b"0123456789"))
+
+    assert seen == [("10", b"0123456789")]
+    assert result.etag == '"abc"'
+    await client.close()
+
+
+class _PipeReader:
+    """File-like object without ``seek``/``tell``, like a pipe or socket reader."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self._data)
+        chunk, self._data = self._data[:size], self._data[size:]
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_put_object_sends_non_seekable_stream_with_content_length():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers.get("Content-Length"), request.headers.get("Transfer-Encoding"), request.content))
+        return httpx.Response(200, headers={"ETag": '"abc"'})
+
+    client = _client_with(handler)
+    await client.put_object("bucket", "pipe.bin", _PipeReader(b"0123456789"))
+
+    assert seen == [("10", None, b"0123456789")]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_body", [io.BytesIO, _PipeReader], ids=["seekable", "non-seekable"])
+async def test_put_object_retries_streamed_body_after_503(monkeypatch, make_body):
+    from omnixstorage import _http
+
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(_http.asyncio, "sleep", fake_sleep)
+    seen = []
+
+    def handler(request):
+        seen.append(request.content)
+        if len(seen) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, headers={"ETag": '"abc"'})
+
+    client = _client_with(handler)
+    client._chunk_size = 3
+    result = await client.put_object("bucket", "file.bin", make_body(b"0123456789"))
+
+    assert seen == [b"0123456789", b"0123456789"]
+    assert result.etag == '"abc"'
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_remove_objects_splits_into_1000_key_batches():
+    batch_sizes = []
+
+    def handler(request):
+        batch_sizes.append(request.content.count(b"<Key>"))
+        return httpx.Response(200)
+
+    client = _client_with(handler)
+    names = [f"obj-{i}" for i in range(2500)]
+
+    result = await client.remove_objects("bucket", names, concurrency=2)
+
+    assert sorted(batch_sizes) == [500, 1000, 1000]
+    assert [d["key"] for d in result["deleted"]] == names
+    assert result["errors"] == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_xml_request_bodies_escape_keys_and_etags():
+    payloads = []
+
+    def handler(request):
+        payloads.append(request.content)
+        return httpx.Response(200)
+
+    client = _client_with(handler)
+    await client.remove_objects("bucket", ["a&b<c>.txt"])
+    await client.complete_multipart_upload("bucket", "key", "up-1", [{"part_number": "1", "etag": "e&1"}])
+
+    for payload in payloads:
+        ET.fromstring(payload)
+    assert payloads[0] == b"<Delete><Object><Key>a&amp;b&lt;c&gt;.txt</Key></Object></Delete>"
+    assert payloads[1] == (
+        b'<CompleteMultipartUpload><Part><PartNumber>1</PartNumber><ETag>"e&amp;1"</ETag></Part></CompleteMultipartUpload>'
+    )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_xml_responses_are_parsed_with_or_without_namespace():
+    ns = ' xmlns="http://s3.amazonaws.com/doc/2006-03-01/"'
+    bodies = {
+        "delete": (
+            f"<DeleteResult{ns}><Deleted><Key>a.txt</Key></Deleted>"
+            "<Error><Key>b.txt</Key><Code>AccessDenied</Code><Message>Denied</Message></Error></DeleteResult>"
+        ),
+        "uploads": "<InitiateMultipartUploadResult><Bucket>bucket</Bucket><UploadId>up-1</UploadId></InitiateMultipartUploadResult>",
+        "uploadId": f'<CompleteMultipartUploadResult{ns}><Location>http://x/b/k</Location><ETag>"etag-3"</ETag></CompleteMultipartUploadResult>',
+    }
+
+    def handler(request):
+        query = request.url.query.decode()
+        return httpx.Response(200, text=bodies[query.split("=")[0]])
+
+    client = _client_with(handler)
+
+    removed = await client.remove_objects("bucket", ["a.txt", "b.txt"])
+    init = await client.initiate_multipart_upload("bucket", "key")
+    complete = await client.complete_multipart_upload("bucket", "key", "up-1", [{"part_number": "1", "etag": "e1"}])
+
+    assert removed == {"deleted": [{"key": "a.txt"}], "errors": [{"key": "b.txt", "code": "AccessDenied", "message": "Denied"}]}
+    assert init == {"upload_id": "up-1"}
+    assert complete == {"etag": "etag-3", "location": "http://x/b/k"}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_multipart_calls_send_upload_id_as_query_params():
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.raw_path.decode()))
+        return httpx.Response(200, headers={"ETag": '"e1"'})
+
+    client = _client_with(handler)
+    await client.upload_part("bucket", "big file.bin", "id/+=", 3, io.BytesIO(b"part"))
+    await client.abort_multipart_upload("bucket", "big file.bin", "id/+=")
+
+    assert seen == [
+        ("PUT", "/bucket/big%20file.bin?partNumber=3&uploadId=id%2F%2B%3D"),
+        ("DELETE", "/bucket/big%20file.bin?uploadId=id%2F%2B%3D"),
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_multipart_session_reuses_encoded_path():
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.raw_path.decode()))
+        if request.url.query == b"uploads":
+            return httpx.Response(200, text="<InitiateMultipartUploadResult><UploadId>id/+=</UploadId></InitiateMultipartUploadResult>")
+        return httpx.Response(200, headers={"ETag": '"e1"'})
+
+    client = _client_with(handler)
+    upload = await client.open_multipart_upload("bucket", "big file.bin")
+    part = await client.upload_session_part(upload, 1, io.BytesIO(b"part"))
+    await client.complete_upload_session(upload, [part])
+
+    assert upload.upload_id == "id/+="
+    assert upload.path == "/bucket/big%20file.bin"
+    assert seen == [
+        ("POST", "/bucket/big%20file.bin?uploads"),
+        ("PUT", "/bucket/big%20file.bin?partNumber=1&uploadId=id%2F%2B%3D"),
+        ("POST", "/bucket/big%20file.bin?uploadId=id%2F%2B%3D"),
+    ]
+    await client.close()
+
+
+@pytest.mark.parametrize(
+    "host, expected",
+    [
+        ("localhost", True),
+        ("127.0.0.1", True),
+        ("::1", True),
+        ("[::1]", True),
+        ("10.0.0.5", True),
+        ("172.16.0.1", True),
+        ("172.31.255.1", True),
+        ("192.168.1.10", True),
+        ("minio.local", True),
+        ("storage.internal", True),
+        ("172.32.0.1", False),
+        ("8.8.8.8", False),
+        ("storage-public.kegeosapps.com", False),
+        ("localhost.example.com", False),
+    ],
+)
+def test_is_internal_host(host, expected):
+    assert OmnixClient._is_internal_host(host) is expected
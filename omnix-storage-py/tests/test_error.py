@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+
+from omnixstorage.error import (
+    AccessDeniedException,
+    AuthenticationException,
+    BucketAlreadyExistsException,
+    BucketNotFoundException,
+    InvalidObjectNameException,
+    ObjectNotFoundException,
+    OmnixStorageException,
+    ServerException,
+)
+
+
+@pytest.mark.parametrize(
+    "exc, message, status_code, error_code",
+    [
+        (BucketNotFoundException("photos"), "Bucket 'photos' not found.", 404, "NoSuchBucket"),
+        (BucketAlreadyExistsException("photos"), "Bucket 'photos' already exists.", 409, "BucketAlreadyExists"),
+        (ObjectNotFoundException("photos", "a.jpg"), "Object 'a.jpg' not found in bucket 'photos'.", 404, "NoSuchKey"),
+        (InvalidObjectNameException("a\x00b"), "Object name 'a\x00b' is invalid.", None, None),
+        (ServerException("Request failed with status 500", 500), "Request failed with status 500", 500, None),
+    ],
+)
+def test_exception_messages_and_codes(exc, message, status_code, error_code):
+    assert str(exc) == message
+    assert exc.status_code == status_code
+    assert exc.error_code == error_code
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        OmnixStorageException("m", 500, "X"),
+        BucketNotFoundException("photos"),
+        BucketAlreadyExistsException("photos"),
+        ObjectNotFoundException("photos", "a.jpg"),
+        InvalidObjectNameException("a\x00b"),
+        AuthenticationException("Invalid credentials"),
+        AccessDeniedException("Forbidden"),
+        ServerException("Request failed with status 503", 503, "SlowDown"),
+    ],
+    ids=lambda exc: type(exc).__name__,
+)
+def test_exceptions_survive_pickle_round_trip(exc):
+    restored = pickle.loads(pickle.dumps(exc))
+
+    assert type(restored) is type(exc)
+    assert str(restored) == str(exc)
+    assert (restored.status_code, restored.error_code) == (exc.status_code, exc.error_code)
@@ -0,0 +1,109 @@
+import io
+
+import httpx
+import pytest
+
+import omnixstorage
+from omnixstorage import _http
+from omnixstorage._http import HttpClient
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(_http.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client_with(handler, max_retries=3) -> HttpClient:
+    client = HttpClient(max_retries=max_retries)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_status_and_honours_retry_after(no_sleep):
+    statuses = iter([503, 429, 200])
+
+    def handler(request):
+        status = next(statuses)
+        headers = {"Retry-After": "2"} if status == 429 else {}
+        return httpx.Response(status, headers=headers)
+
+    client = _client_with(handler)
+    response = await client.get("http://storage.test/bucket")
+
+    assert response.status_code == 200
+    assert len(no_sleep) == 2
+    assert 0.5 <= no_sleep[0] <= 1.5
+    assert no_sleep[1] == 2.0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_returns_last_transient_response_when_retries_exhausted(no_sleep):
+    client = _client_with(lambda request: httpx.Response(502), max_retries=2)
+
+    response = await client.get("http://storage.test/bucket")
+
+    assert response.status_code == 502
+    assert len(no_sleep) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, attempts", [(502, 1), (504, 1), (503, 2)])
+async def test_post_is_only_retried_when_the_server_refused_it(no_sleep, status, attempts):
+    statuses = iter([status, 200])
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        return httpx.Response(next(statuses))
+
+    client = _client_with(handler)
+    response = await client.post("http://storage.test/bucket/key?uploads", content=b"")
+
+    assert seen == ["POST"] * attempts
+    assert response.status_code == (status if attempts == 1 else 200)
+    await client.close()
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        assert HttpClient._backoff_delay(attempt) <= _http.RETRY_MAX_DELAY * 1.5
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_is_chunked_and_replayed_on_retry(no_sleep):
+    bodies = []
+    statuses = iter([503, 200])
+
+    def handler(request):
+        bodies.append((request.headers.get("Content-Length"), request.content))
+        return httpx.Response(next(statuses))
+
+    client = _client_with(handler)
+    fp = io.BytesIO(b"skip:" + b"x" * 10)
+    fp.seek(5)
+    upload = _http.UploadStream(fp, chunk_size=4)
+
+    response = await client.put(
+        "http://storage.test/bucket/key",
+        content=upload,
+        headers={"Content-Length": str(upload.length)},
+    )
+
+    assert response.status_code == 200
+    assert bodies == [("10", b"x" * 10), ("10", b"x" * 10)]
+    await client.close()
+
+
+def test_default_user_agent_identifies_sdk():
+    client = HttpClient()
+
+    assert client._client.headers["User-Agent"] == f"omnix-storage-py/{omnixstorage.__version__}"
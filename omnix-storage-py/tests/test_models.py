@@ -0,0 +1,63 @@
+import pickle
+from datetime import UTC, datetime
+
+import pytest
+
+from omnixstorage.models import (
+    Bucket,
+    BucketPolicyResult,
+    ListObjectsResult,
+    MultipartUpload,
+    ObjectMetadata,
+    PresignedUrlResult,
+    PutObjectResult,
+)
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Bucket(name="b", creation_date=datetime(2024, 1, 1, tzinfo=UTC)),
+        ObjectMetadata(object_name="k", bucket_name="b"),
+        ListObjectsResult(),
+        PutObjectResult(bucket_name="b", object_name="k", etag="e"),
+        BucketPolicyResult(bucket_name="b"),
+        MultipartUpload(bucket_name="b", object_name="k", upload_id="u", path="/b/k"),
+    ],
+)
+def test_models_are_slotted(instance):
+    assert not hasattr(instance, "__dict__")
+
+
+def test_response_models_are_immutable():
+    result = PresignedUrlResult(url="https://x/b/k", expires_at=datetime(2024, 1, 1, tzinfo=UTC))
+
+    with pytest.raises(AttributeError):
+        result.url = "https://evil/b/k"
+    assert result == PresignedUrlResult(url="https://x/b/k", expires_at=datetime(2024, 1, 1, tzinfo=UTC))
+
+
+def test_presigned_url_result_is_the_url_string():
+    expires_at = datetime(2024, 1, 1, tzinfo=UTC)
+    result = PresignedUrlResult(url="https://x/b/k?X-Amz-Signature=abc", expires_at=expires_at)
+
+    assert result.startswith("https://x/b/k")
+    assert result == "https://x/b/k?X-Amz-Signature=abc"
+    assert type(result.url) is str and result.url == result
+    assert result.expires_at == expires_at
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored == result and restored.expires_at == expires_at
+    with pytest.raises(AttributeError):
+        result.expires_at = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def test_empty_defaults_are_independent_mutable_containers():
+    first = ObjectMetadata(object_name="a", bucket_name="b")
+    second = ObjectMetadata(object_name="c", bucket_name="b")
+
+    first.metadata["k"] = "v"
+    assert first.metadata == {"k": "v"} and second.metadata == {}
+    listing = ListObjectsResult()
+    listing.common_prefixes.append("dir/")
+    assert listing.objects == [] and ListObjectsResult().common_prefixes == []
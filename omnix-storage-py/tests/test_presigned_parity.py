@@ -1,20 +1,17 @@
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
-from omnixstorage.client import OmnixClient
+from omnixstorage import client as client_module
 from omnixstorage._signer import AwsSignatureV4Signer
 
 
-@pytest.mark.asyncio
-async def test_presigned_get_uses_public_endpoint_and_sigv4_params():
-    client = OmnixClient(
-        endpoint="storage.kegeosapps.com:443",
-        public_endpoint="https://storage-public.kegeosapps.com",
-        access_key="AKIATESAFEKEY0000001",
-        secret_key="wJalrXUtnFEMIaKkMDENGbPxRfIcxAmPlEkEyZaB",
-        use_ssl=True,
-    )
-
-    result = await client.presigned_get_object(
+@pytest.mark.asyncio(loop_scope="session")
+async def test_presigned_get_uses_public_endpoint_and_sigv4_params(shared_client, assert_sigv4_url):
+    result = await shared_client.presigned_get_object(
         bucket_name="photo-test",
         object_name="images/13-47-42-738.jpg",
         expires_in_seconds=3600,
@@ -22,22 +19,12 @@ async def test_presigned_get_uses_public_endpoint_and_sigv4_params():
     )
 
     assert result.url.startswith("https://storage-public.kegeosapps.com/")
-    assert "X-Amz-Algorithm=AWS4-HMAC-SHA256" in result.url
-    assert "X-Amz-Credential=" in result.url
-    assert "X-Amz-Signature=" in result.url
-
-
-@pytest.mark.asyncio
-async def test_presigned_put_generated_and_browser_safe():
-    client = OmnixClient(
-        endpoint="storage.kegeosapps.com:443",
-        public_endpoint="https://storage-public.kegeosapps.com",
-        access_key="AKIATESAFEKEY0000001",
-        secret_key="wJalrXUtnFEMIaKkMDENGbPxRfIcxAmPlEkEyZaB",
-        use_ssl=True,
-    )
+    assert_sigv4_url(result)
+
 
-    result = await client.presigned_put_object(
+@pytest.mark.asyncio(loop_scope="session")
+async def test_presigned_put_generated_and_browser_safe(shared_client, assert_sigv4_url):
+    result = await shared_client.presigned_put_object(
         bucket_name="photo-test",
         object_name="uploads/test.bin",
         expires_in_seconds=1800,
@@ -45,22 +32,13 @@ async def test_presigned_put_generated_and_browser_safe():
     )
 
     assert result.url.startswith("https://storage-public.kegeosapps.com/")
-    assert "X-Amz-Algorithm=AWS4-HMAC-SHA256" in result.url
-    assert "X-Amz-Signature=" in result.url
-
-
-@pytest.mark.asyncio
-async def test_guardrail_rejects_internal_host_for_browser_urls():
-    client = OmnixClient(
-        endpoint="storage.kegeosapps.com:443",
-        public_endpoint="http://127.0.0.1:9000",
-        access_key="AKIATESAFEKEY0000001",
-        secret_key="wJalrXUtnFEMIaKkMDENGbPxRfIcxAmPlEkEyZaB",
-        use_ssl=True,
-    )
+    assert_sigv4_url(result)
 
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_guardrail_rejects_internal_host_for_browser_urls(internal_public_client):
     with pytest.raises(ValueError, match="internal"):
-        await client.presigned_get_object(
+        await internal_public_client.presigned_get_object(
             bucket_name="photo-test",
             object_name="images/test.jpg",
             expires_in_seconds=3600,
@@ -68,18 +46,10 @@ async def test_guardrail_rejects_internal_host_for_browser_urls():
         )
 
 
-@pytest.mark.asyncio
-async def test_expiry_validation_matches_dotnet_limits():
-    client = OmnixClient(
-        endpoint="storage.kegeosapps.com:443",
-        public_endpoint="https://storage-public.kegeosapps.com",
-        access_key="AKIATESAFEKEY0000001",
-        secret_key="wJalrXUtnFEMIaKkMDENGbPxRfIcxAmPlEkEyZaB",
-        use_ssl=True,
-    )
-
+@pytest.mark.asyncio(loop_scope="session")
+async def test_expiry_validation_matches_dotnet_limits(shared_client):
     with pytest.raises(ValueError, match="604800"):
-        await client.presigned_get_object(
+        await shared_client.presigned_get_object(
             bucket_name="photo-test",
             object_name="images/test.jpg",
             expires_in_seconds=604801,
@@ -108,3 +78,53 @@ def test_signer_respects_https_and_expiry_limits():
             expires_in_seconds=604801,
             use_https=True,
         )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_presigned_urls_are_reused_for_same_inputs(shared_client):
+    first = await shared_client.presigned_get_object("photo-test", "images/a.jpg", 3600)
+    second = await shared_client.presigned_get_object("photo-test", "images/a.jpg", 3600)
+    other = await shared_client.presigned_get_object("photo-test", "images/a.jpg", 1800)
+
+    put = await shared_client.presigned_put_object("photo-test", "images/a.jpg", 3600)
+    put_again = await shared_client.presigned_put_object("photo-test", "images/a.jpg", 3600)
+    typed_put = await shared_client.presigned_put_object("photo-test", "images/a.jpg", 3600, content_type="image/jpeg")
+
+    assert second is first
+    assert other.url != first.url
+    assert "X-Amz-Expires=1800" in other.url
+    assert put_again is put
+    assert put.url != first.url
+    assert typed_put.url != put.url
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cached_presigned_urls_keep_three_quarters_of_their_lifetime(shared_client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client_module, "time", SimpleNamespace(monotonic=lambda: now[0], time=time.time))
+
+    first = await shared_client.presigned_get_object("photo-test", "images/threshold.jpg", 3600)
+    now[0] += 899
+    assert await shared_client.presigned_get_object("photo-test", "images/threshold.jpg", 3600) is first
+
+    now[0] += 1
+    assert await shared_client.presigned_get_object("photo-test", "images/threshold.jpg", 3600) is not first
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_presigned_expires_at_matches_signed_date(shared_client):
+    result = await shared_client.presigned_put_object("photo-test", "images/a.jpg", 900)
+
+    query = parse_qs(urlparse(result.url).query)
+    signed_at = datetime.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+    assert result.expires_at == signed_at + timedelta(seconds=900)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_presigned_get_objects_matches_single_calls(shared_client):
+    single = await shared_client.presigned_get_object("photo-test", "images/a b.jpg", 3600)
+    batch = await shared_client.presigned_get_objects("photo-test", ["images/a b.jpg", "images/c.jpg"], 3600)
+
+    assert batch[0] is single
+    assert batch[1].url.startswith("https://storage-public.kegeosapps.com/photo-test/images%2Fc.jpg?")
+    assert await shared_client.presigned_get_object("photo-test", "images/c.jpg", 3600) is batch[1]